@@ -1,15 +1,27 @@
 """Assessment API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import List, Optional
 from datetime import date
 
 from app.core.security import get_current_user_with_role
-from app.models.assessment import Assessment, CriterionScore, AccreditationLevel
+from app.models.assessment import Assessment, ChapterScore, CriterionScore, AccreditationLevel
 from app.services.assessment_service import assessment_service
 from app.services.hospital_service import hospital_service
 
-router = APIRouter(prefix="/hospitals/{hospital_id}/assessments", tags=["Assessments"])
+router = APIRouter(
+    prefix="/hospitals/{hospital_id}/assessments",
+    tags=["Assessments"],
+    default_response_class=ORJSONResponse,
+)
+
+# Built once at import so per-request serialization is a single
+# pydantic-core call instead of one .model_dump() per element.
+_CHAPTER_SCORES_ADAPTER = TypeAdapter(List[ChapterScore])
 
 
 class CriterionScoreInput(BaseModel):
@@ -59,60 +71,116 @@ class AssessmentSummary(BaseModel):
     is_submitted: bool
 
 
+# Built once at import; validates and dumps the whole summary list in one
+# pydantic-core call instead of one model construction per row.
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[AssessmentSummary])
+
+
+async def parse_assessment_create(request: Request) -> AssessmentCreate:
+    """Parse a create body straight from raw bytes in pydantic-core."""
+    try:
+        return AssessmentCreate.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+async def parse_assessment_update(request: Request) -> AssessmentUpdate:
+    """Parse an update body straight from raw bytes in pydantic-core."""
+    try:
+        return AssessmentUpdate.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
 @router.get(
     "",
-    response_model=List[AssessmentSummary],
     summary="Get all assessments for a hospital"
 )
 async def get_assessments(
     hospital_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get all assessments for a specific hospital."""
-    # Verify hospital exists
-    hospital = hospital_service.get_by_id(hospital_id)
-    if not hospital:
+    # Verify hospital exists and fetch in one service call
+    assessments = assessment_service.fetch_for_hospital(hospital_id)
+    if assessments is None:
         raise HTTPException(status_code=404, detail="Hospital not found")
-    
-    assessments = assessment_service.get_by_hospital(hospital_id)
-    
-    return [
-        AssessmentSummary(
-            id=a.id,
-            hospital_id=a.hospital_id,
-            assessment_date=a.assessment_date,
-            assessment_cycle=a.assessment_cycle,
-            assessment_type=a.assessment_type,
-            overall_maturity_score=a.overall_maturity_score,
-            accreditation_level=a.accreditation_level,
-            part_scores=a.part_scores,
-            data_completeness=a.data_completeness,
-            is_draft=a.is_draft,
-            is_submitted=a.is_submitted,
-        )
+
+    # The list only changes on writes, so polling clients can be served
+    # a 304 without any serialization work.
+    etag = _assessments_etag(assessments)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Stream the JSON array row by row so hospitals with long assessment
+    # histories do not inflate time-to-first-byte or peak memory.
+    return StreamingResponse(
+        _stream_assessment_summaries(assessments),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+def _assessments_etag(assessments) -> str:
+    """Build a weak ETag from the newest update time and the list size."""
+    if not assessments:
+        return 'W/"empty"'
+    newest = max(a.updated_at for a in assessments)
+    return f'W/"{newest.timestamp()}-{len(assessments)}"'
+
+
+def _stream_assessment_summaries(assessments):
+    """Yield a JSON array of assessment summaries one row at a time."""
+    summaries = _SUMMARY_LIST_ADAPTER.validate_python([
+        {
+            "id": a.id,
+            "hospital_id": a.hospital_id,
+            "assessment_date": a.assessment_date,
+            "assessment_cycle": a.assessment_cycle,
+            "assessment_type": a.assessment_type,
+            "overall_maturity_score": a.overall_maturity_score,
+            "accreditation_level": a.accreditation_level,
+            "part_scores": a.part_scores,
+            "data_completeness": a.data_completeness,
+            "is_draft": a.is_draft,
+            "is_submitted": a.is_submitted,
+        }
         for a in assessments
-    ]
+    ])
+    yield b"["
+    first = True
+    for row in _SUMMARY_LIST_ADAPTER.dump_python(summaries, mode="json"):
+        if not first:
+            yield b","
+        first = False
+        yield orjson.dumps(row)
+    yield b"]"
 
 
 @router.get(
     "/latest",
-    response_model=Assessment,
     summary="Get latest assessment for a hospital"
 )
 async def get_latest_assessment(
     hospital_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get the most recent assessment for a hospital."""
-    hospital = hospital_service.get_by_id(hospital_id)
-    if not hospital:
+    assessments = assessment_service.fetch_for_hospital(hospital_id)
+    if assessments is None:
         raise HTTPException(status_code=404, detail="Hospital not found")
-    
-    assessment = assessment_service.get_latest_by_hospital(hospital_id)
-    if not assessment:
+
+    if not assessments:
         raise HTTPException(status_code=404, detail="No assessments found")
-    
-    return assessment
+    assessment = assessments[-1]
+
+    etag = f'W/"{assessment.updated_at.timestamp()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return ORJSONResponse(assessment.model_dump(mode="json"), headers={"ETag": etag})
 
 
 @router.get(
@@ -124,11 +192,11 @@ async def get_assessment_trends(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get score trends across all assessments for a hospital."""
-    hospital = hospital_service.get_by_id(hospital_id)
-    if not hospital:
+    assessments = assessment_service.fetch_for_hospital(hospital_id)
+    if assessments is None:
         raise HTTPException(status_code=404, detail="Hospital not found")
-    
-    return assessment_service.get_trends(hospital_id)
+
+    return assessment_service.build_trends(assessments)
 
 
 @router.get(
@@ -142,10 +210,11 @@ async def compare_assessments(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Compare two assessments and show differences."""
-    # Verify both assessments belong to this hospital
-    a1 = assessment_service.get_by_id(assessment_1)
-    a2 = assessment_service.get_by_id(assessment_2)
-    
+    # Verify both assessments belong to this hospital (batched fetch)
+    assessments = assessment_service.get_by_ids([assessment_1, assessment_2])
+    a1 = assessments.get(assessment_1)
+    a2 = assessments.get(assessment_2)
+
     if not a1 or a1.hospital_id != hospital_id:
         raise HTTPException(status_code=404, detail="Assessment 1 not found")
     if not a2 or a2.hospital_id != hospital_id:
@@ -156,7 +225,6 @@ async def compare_assessments(
 
 @router.get(
     "/{assessment_id}",
-    response_model=Assessment,
     summary="Get assessment details"
 )
 async def get_assessment(
@@ -165,10 +233,10 @@ async def get_assessment(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get detailed information about a specific assessment."""
-    assessment = assessment_service.get_by_id(assessment_id)
-    if not assessment or assessment.hospital_id != hospital_id:
+    assessment = assessment_service.get_scoped(assessment_id, hospital_id)
+    if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
-    return assessment
+    return ORJSONResponse(assessment.model_dump(mode="json"))
 
 
 @router.get(
@@ -181,12 +249,12 @@ async def get_chapter_scores(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get detailed chapter-level scores for an assessment."""
-    assessment = assessment_service.get_by_id(assessment_id)
-    if not assessment or assessment.hospital_id != hospital_id:
+    assessment = assessment_service.get_scoped(assessment_id, hospital_id)
+    if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
     chapter_scores = assessment_service.get_chapter_scores(assessment_id)
-    return {"chapter_scores": [cs.model_dump() for cs in chapter_scores]}
+    return {"chapter_scores": _CHAPTER_SCORES_ADAPTER.dump_python(chapter_scores, mode="json")}
 
 
 @router.post(
@@ -196,7 +264,7 @@ async def get_chapter_scores(
 )
 async def create_assessment(
     hospital_id: str,
-    data: AssessmentCreate,
+    data: AssessmentCreate = Depends(parse_assessment_create),
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Create a new assessment for a hospital."""
@@ -205,9 +273,11 @@ async def create_assessment(
     if not hospital:
         raise HTTPException(status_code=404, detail="Hospital not found")
     
-    # Convert criterion scores
+    # Convert criterion scores. The input was already validated at the
+    # request boundary, so copy fields directly instead of dumping to an
+    # intermediate dict and re-validating.
     criterion_scores = [
-        CriterionScore(**cs.model_dump())
+        CriterionScore.model_construct(**cs.__dict__)
         for cs in data.criterion_scores
     ]
     
@@ -223,7 +293,9 @@ async def create_assessment(
         is_draft=data.is_draft,
     )
     
-    return assessment_service.create(assessment)
+    # Mutations persist to the JSON store; run them off the event loop so
+    # the file write does not stall other in-flight requests.
+    return await run_in_threadpool(assessment_service.create, assessment)
 
 
 @router.patch(
@@ -234,23 +306,28 @@ async def create_assessment(
 async def update_assessment(
     hospital_id: str,
     assessment_id: str,
-    data: AssessmentUpdate,
+    data: AssessmentUpdate = Depends(parse_assessment_update),
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Update an existing assessment."""
-    assessment = assessment_service.get_by_id(assessment_id)
-    if not assessment or assessment.hospital_id != hospital_id:
+    assessment = assessment_service.get_scoped(assessment_id, hospital_id)
+    if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
+    # Only touch fields the client actually sent instead of dumping the
+    # whole model (which would also serialize criterion_scores just to
+    # rebuild them below).
     updates = {}
-    for k, v in data.model_dump().items():
-        if v is not None:
-            if k == 'criterion_scores':
-                updates[k] = [CriterionScore(**cs) for cs in v]
-            else:
-                updates[k] = v
+    for k in data.model_fields_set:
+        v = getattr(data, k)
+        if v is None:
+            continue
+        if k == 'criterion_scores':
+            updates[k] = [CriterionScore.model_construct(**cs.__dict__) for cs in v]
+        else:
+            updates[k] = v
     
-    updated = assessment_service.update(assessment_id, updates)
+    updated = await run_in_threadpool(assessment_service.update, assessment_id, updates)
     return updated
 
 
@@ -264,11 +341,11 @@ async def delete_assessment(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Delete an assessment."""
-    assessment = assessment_service.get_by_id(assessment_id)
-    if not assessment or assessment.hospital_id != hospital_id:
+    assessment = assessment_service.get_scoped(assessment_id, hospital_id)
+    if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
-    success = assessment_service.delete(assessment_id)
+    success = await run_in_threadpool(assessment_service.delete, assessment_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete assessment")
     
@@ -285,15 +362,15 @@ async def submit_assessment(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Submit a draft assessment for review."""
-    assessment = assessment_service.get_by_id(assessment_id)
-    if not assessment or assessment.hospital_id != hospital_id:
+    assessment = assessment_service.get_scoped(assessment_id, hospital_id)
+    if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
     
     if assessment.is_submitted:
         raise HTTPException(status_code=400, detail="Assessment already submitted")
     
     from datetime import datetime
-    updated = assessment_service.update(assessment_id, {
+    updated = await run_in_threadpool(assessment_service.update, assessment_id, {
         "is_draft": False,
         "is_submitted": True,
         "submitted_at": datetime.utcnow(),
@@ -302,3 +379,9 @@ async def submit_assessment(
     return {"message": "Assessment submitted successfully", "assessment": updated}
 
 
+
+
+# Warm the pydantic-core validators at import time so the first request
+# never pays a deferred validator-build cost.
+for _model in (CriterionScoreInput, AssessmentCreate, AssessmentUpdate, AssessmentSummary):
+    _model.model_rebuild()
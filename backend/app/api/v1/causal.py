@@ -1,12 +1,17 @@
 """Causal inference API endpoints - QI Team only."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 
 from app.core.security import require_role, UserRole, get_current_user_with_role
 from app.services.causal_service import get_causal_service, CausalMethod
 
-router = APIRouter(prefix="/causal", tags=["Causal Inference"])
+router = APIRouter(
+    prefix="/causal",
+    tags=["Causal Inference"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class EstimateEffectRequest(BaseModel):
@@ -164,7 +169,7 @@ async def get_methods(
     Available to all authenticated users.
     """
     service = get_causal_service()
-    return {"methods": service.get_available_methods()}
+    return Response(service.get_methods_json(), media_type="application/json")
 
 
 @router.get(
@@ -222,20 +227,10 @@ async def get_graph_summary(
     Available to all authenticated users.
     """
     service = get_causal_service()
-    graph = service._causal_graph
-    
-    return {
-        "total_nodes": len(graph["nodes"]),
-        "total_edges": len(graph["edges"]),
-        "nodes_by_part": _count_by_part(graph["nodes"]),
-        "edges_sample": graph["edges"][:10],
-    }
-
-
-def _count_by_part(nodes: dict) -> dict:
-    """Count nodes by part."""
-    counts = {}
-    for node_id, node_data in nodes.items():
-        part = node_data.get("part", "Unknown")
-        counts[part] = counts.get(part, 0) + 1
-    return counts
+    return service.get_graph_summary()
+
+
+# Warm the pydantic-core validators at import time so the first request
+# never pays a deferred validator-build cost.
+for _model in (EstimateEffectRequest, CounterfactualRequest, RootCauseRequest, CascadeRequest):
+    _model.model_rebuild()
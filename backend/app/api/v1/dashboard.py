@@ -1,5 +1,11 @@
 """Dashboard API endpoints."""
+import heapq
+from bisect import bisect_right
+from types import MappingProxyType
+
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import date
@@ -9,7 +15,21 @@ from app.services.hospital_service import hospital_service
 from app.services.assessment_service import assessment_service
 from app.services.standards_service import standards_service, CriterionCategory
 
-router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["Dashboard"],
+    default_response_class=ORJSONResponse,
+)
+
+# Frozen lookup tables shared by every request.
+_PRIORITY_NAMES = ("critical", "high", "medium")
+_TARGET_MAP = MappingProxyType({
+    "not_accredited": "pass",
+    "pass": "good",
+    "good": "very_good",
+    "very_good": "excellent",
+    "excellent": "excellent",
+})
 
 
 class DomainScore(BaseModel):
@@ -22,6 +42,19 @@ class DomainScore(BaseModel):
     chapter_count: int
 
 
+# Static portion of each DomainScore; only the score changes per request.
+_DOMAIN_SCORE_TEMPLATES = [
+    {
+        "part": p.number,
+        "name": p.name,
+        "weight": p.weight,
+        "color": p.color,
+        "chapter_count": len(p.chapters),
+    }
+    for p in standards_service.get_parts()
+]
+
+
 class ChapterTrend(BaseModel):
     """Trend data for a chapter."""
     chapter_id: str
@@ -104,100 +137,83 @@ async def get_dashboard(
     if latest and previous and latest.overall_maturity_score and previous.overall_maturity_score:
         score_change = round(latest.overall_maturity_score - previous.overall_maturity_score, 2)
     
-    # Get domain scores
-    domain_scores = []
-    parts = standards_service.get_parts()
-    for part in parts:
-        part_score = latest.part_scores.get(part.number, 0) if latest else 0
-        domain_scores.append(DomainScore(
-            part=part.number,
-            name=part.name,
-            score=part_score,
-            weight=part.weight,
-            color=part.color,
-            chapter_count=len(part.chapters),
-        ))
+    # Get domain scores (static part metadata overlaid with the score)
+    domain_scores = [
+        DomainScore.model_construct(
+            score=latest.part_scores.get(tpl["part"], 0) if latest else 0,
+            **tpl,
+        )
+        for tpl in _DOMAIN_SCORE_TEMPLATES
+    ]
     
     # Calculate criteria stats
     all_criteria = standards_service.get_all_criteria()
     total_criteria = len(all_criteria)
     
-    score_lookup = {}
-    if latest:
-        score_lookup = {cs.criterion_id: cs.score for cs in latest.criterion_scores}
-    
+    score_lookup = latest.get_score_lookup() if latest else {}
+
     criteria_assessed = len(score_lookup)
     compliance_percentage = round(criteria_assessed / total_criteria * 100, 1) if total_criteria > 0 else 0
     
-    # Category breakdown
-    essential_criteria = [c for c in all_criteria if c.category == CriterionCategory.ESSENTIAL]
-    core_criteria = [c for c in all_criteria if c.category == CriterionCategory.CORE]
-    basic_criteria = [c for c in all_criteria if c.category == CriterionCategory.BASIC]
-    
-    def count_met(criteria_list, threshold=3.0):
-        met = 0
-        for c in criteria_list:
-            if c.id in score_lookup and score_lookup[c.id] >= threshold:
-                met += 1
-        return met
-    
-    essential_met = count_met(essential_criteria)
-    core_met = count_met(core_criteria)
-    basic_met = count_met(basic_criteria)
+    # Category breakdown (precomputed on the standards service)
+    essential_criteria = standards_service.get_criteria_by_category(CriterionCategory.ESSENTIAL)
+    core_criteria = standards_service.get_criteria_by_category(CriterionCategory.CORE)
+    basic_criteria = standards_service.get_criteria_by_category(CriterionCategory.BASIC)
+
+    scores_np = latest.get_scores_array() if latest else None
+
+    def count_met(category, threshold=3.0):
+        if scores_np is None:
+            return 0
+        # NaN (unassessed) compares False, matching the old dict check
+        with np.errstate(invalid="ignore"):
+            met = (scores_np >= threshold) & standards_service.get_category_mask(category)
+        return int(met.sum())
+
+    essential_met = count_met(CriterionCategory.ESSENTIAL)
+    core_met = count_met(CriterionCategory.CORE)
+    basic_met = count_met(CriterionCategory.BASIC)
     
-    # Find critical gaps (essential criteria with low scores)
+    # Find critical gaps (essential criteria with low scores). Only the
+    # top 15 are returned, so a bounded heap keeps selection at O(N)
+    # instead of sorting (and materializing) every gap.
+    def iter_gaps():
+        for criterion in all_criteria:
+            score = score_lookup.get(criterion.id)
+            if score is None or score >= 3.0:
+                continue
+            # Determine priority (integer-encoded so it doubles as the sort key)
+            if criterion.category == CriterionCategory.ESSENTIAL and score < 2.0:
+                priority = 0  # critical
+            elif criterion.category == CriterionCategory.ESSENTIAL:
+                priority = 1  # high
+            elif criterion.category == CriterionCategory.CORE and score < 2.5:
+                priority = 1  # high
+            else:
+                priority = 2  # medium
+            yield priority, score, criterion
+
     critical_gaps = []
-    for criterion in all_criteria:
-        if criterion.id in score_lookup:
-            score = score_lookup[criterion.id]
-            if score < 3.0:
-                # Find chapter for this criterion
-                chapter_name = ""
-                chapter_id = ""
-                for part in parts:
-                    for chapter in part.chapters:
-                        for c in chapter.criteria:
-                            if c.id == criterion.id:
-                                chapter_name = chapter.name
-                                chapter_id = chapter.id
-                                break
-                
-                # Determine priority
-                if criterion.category == CriterionCategory.ESSENTIAL and score < 2.0:
-                    priority = "critical"
-                elif criterion.category == CriterionCategory.ESSENTIAL:
-                    priority = "high"
-                elif criterion.category == CriterionCategory.CORE and score < 2.5:
-                    priority = "high"
-                else:
-                    priority = "medium"
-                
-                critical_gaps.append(CriticalGap(
-                    criterion_id=criterion.id,
-                    criterion_name=criterion.name,
-                    chapter_id=chapter_id,
-                    chapter_name=chapter_name,
-                    score=score,
-                    category=criterion.category.value,
-                    priority=priority,
-                ))
-    
-    # Sort gaps by priority
-    priority_order = {"critical": 0, "high": 1, "medium": 2}
-    critical_gaps.sort(key=lambda g: (priority_order.get(g.priority, 3), g.score))
+    for priority, score, criterion in heapq.nsmallest(
+        15, iter_gaps(), key=lambda g: (g[0], g[1])
+    ):
+        chapter = standards_service.get_chapter_for_criterion(criterion.id)
+        critical_gaps.append(CriticalGap.model_construct(
+            criterion_id=criterion.id,
+            criterion_name=criterion.name,
+            chapter_id=chapter.id if chapter else "",
+            chapter_name=chapter.name if chapter else "",
+            score=score,
+            category=criterion.category.value,
+            priority=_PRIORITY_NAMES[priority],
+        ))
     
     # Determine target level
     current_level = latest.accreditation_level.value if latest else "not_accredited"
-    target_map = {
-        "not_accredited": "pass",
-        "pass": "good",
-        "good": "very_good",
-        "very_good": "excellent",
-        "excellent": "excellent",
-    }
-    target_level = target_map.get(current_level, "good")
+    target_level = _TARGET_MAP.get(current_level, "good")
     
-    return DashboardData(
+    # Every field below comes from our own services, so skip re-validating
+    data = DashboardData.model_construct(
         hospital_id=hospital_id,
         hospital_name=hospital.name,
         latest_assessment_id=latest.id if latest else None,
@@ -218,8 +234,11 @@ async def get_dashboard(
         basic_met=basic_met,
         basic_total=len(basic_criteria),
         assessment_count=len(assessments),
-        critical_gaps=critical_gaps[:15],  # Top 15 gaps
+        critical_gaps=critical_gaps,  # Top 15 gaps
     )
+    # Serialize in pydantic-core + orjson rather than jsonable_encoder's
+    # Python-level recursion over the nested models.
+    return ORJSONResponse(data.model_dump(mode="json"))
 
 
 @router.get(
@@ -231,32 +250,52 @@ async def get_dashboard_trends(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get trend data for dashboard visualizations."""
-    hospital = hospital_service.get_by_id(hospital_id)
-    if not hospital:
+    # One fetch serves both the overall trends and the chapter sparklines
+    assessments = assessment_service.fetch_for_hospital(hospital_id)
+    if assessments is None:
         raise HTTPException(status_code=404, detail="Hospital not found")
-    
-    trends = assessment_service.get_trends(hospital_id)
-    
+
+    trends = assessment_service.build_trends(assessments)
+
     # Add chapter-level trends for sparklines
-    assessments = assessment_service.get_by_hospital(hospital_id)
     chapter_trends = []
-    
+
     chapters = standards_service.get_all_chapters()
+    # Stack the dense per-assessment score vectors into an
+    # (assessments x criteria) matrix so every chapter's fallback
+    # averages come from one vectorized nanmean over its column block
+    # instead of a Python loop per assessment.
+    scores_mat = (
+        np.stack([a.get_scores_array() for a in assessments])
+        if assessments else None
+    )
+    dates = [a.assessment_date.isoformat() for a in assessments]
     for chapter in chapters:
+        if scores_mat is not None:
+            indices = standards_service.get_chapter_criterion_indices(chapter.id)
+            chapter_block = scores_mat[:, indices]
+            assessed_counts = (~np.isnan(chapter_block)).sum(axis=1)
+            sums = np.nansum(chapter_block, axis=1)
+            means = np.divide(
+                sums,
+                assessed_counts,
+                out=np.full(len(assessments), np.nan, dtype=np.float32),
+                where=assessed_counts > 0,
+            )
+
         scores = []
-        for assessment in assessments:
-            # Calculate chapter score from criterion scores
-            score_lookup = {cs.criterion_id: cs.score for cs in assessment.criterion_scores}
-            chapter_criteria_scores = []
-            for c in chapter.criteria:
-                if c.id in score_lookup:
-                    chapter_criteria_scores.append(score_lookup[c.id])
-            
-            if chapter_criteria_scores:
-                avg = sum(chapter_criteria_scores) / len(chapter_criteria_scores)
+        for i, assessment in enumerate(assessments):
+            # Use the chapter score stored at assessment-write time;
+            # fall back to the derived average for records saved before
+            # chapter_scores existed.
+            score = assessment.chapter_scores.get(chapter.id)
+            if score is None and scores_mat is not None and assessed_counts[i]:
+                score = round(float(means[i]), 2)
+
+            if score is not None:
                 scores.append({
-                    "date": assessment.assessment_date.isoformat(),
-                    "score": round(avg, 2),
+                    "date": dates[i],
+                    "score": score,
                 })
         
         current_score = scores[-1]["score"] if scores else 0
@@ -297,20 +336,21 @@ async def get_domain_detail(
         raise HTTPException(status_code=404, detail="Part not found")
     
     latest = assessment_service.get_latest_by_hospital(hospital_id)
-    score_lookup = {}
-    if latest:
-        score_lookup = {cs.criterion_id: cs.score for cs in latest.criterion_scores}
-    
+    score_lookup = latest.get_score_lookup() if latest else {}
+
     chapters_data = []
     for chapter in part.chapters:
+        # One pass per chapter: build the criteria rows and keep running
+        # totals for the average instead of a second scoring loop.
         criteria_data = []
-        chapter_scores = []
-        
+        score_sum = 0.0
+        criteria_assessed = 0
+
         for criterion in chapter.criteria:
             score = score_lookup.get(criterion.id)
             if score is not None:
-                chapter_scores.append(score)
-            
+                score_sum += score
+                criteria_assessed += 1
             criteria_data.append({
                 "id": criterion.id,
                 "name": criterion.name,
@@ -319,9 +359,9 @@ async def get_domain_detail(
                 "score": score,
                 "status": _get_status(score) if score else "not_assessed",
             })
-        
-        chapter_avg = sum(chapter_scores) / len(chapter_scores) if chapter_scores else None
-        
+
+        chapter_avg = score_sum / criteria_assessed if criteria_assessed else None
+
         chapters_data.append({
             "id": chapter.id,
             "name": chapter.name,
@@ -329,7 +369,7 @@ async def get_domain_detail(
             "focus": chapter.focus,
             "score": round(chapter_avg, 2) if chapter_avg else None,
             "criteria_count": len(chapter.criteria),
-            "criteria_assessed": len(chapter_scores),
+            "criteria_assessed": criteria_assessed,
             "criteria": criteria_data,
         })
     
@@ -343,16 +383,16 @@ async def get_domain_detail(
     }
 
 
+# Status bands for _get_status: scores in [-inf,2) are critical,
+# [2,3) needs_improvement, [3,4) good, [4,inf) excellent.
+_STATUS_THRESHOLDS = (2.0, 3.0, 4.0)
+_STATUS_NAMES = ("critical", "needs_improvement", "good", "excellent")
+
+
 def _get_status(score: Optional[float]) -> str:
     """Get status based on score."""
     if score is None:
         return "not_assessed"
-    if score >= 4.0:
-        return "excellent"
-    if score >= 3.0:
-        return "good"
-    if score >= 2.0:
-        return "needs_improvement"
-    return "critical"
+    return _STATUS_NAMES[bisect_right(_STATUS_THRESHOLDS, score)]
 
 
@@ -2,7 +2,8 @@
 WHO DISAH Digital Health API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 from typing import Dict, Optional
 
@@ -17,15 +18,32 @@ class ReadinessAssessmentRequest(BaseModel):
     assessments: Dict[str, str]  # intervention_id -> readiness_level
 
 
+# The DISAH framework, HA alignment map and readiness-level catalogue
+# are static, so their JSON is built once at import time.
+_FRAMEWORK_JSON = orjson.dumps(get_digital_health_service().get_framework())
+_HA_ALIGNMENT_JSON = orjson.dumps(
+    {"alignments": get_digital_health_service().get_ha_alignment()}
+)
+_READINESS_LEVELS_JSON = orjson.dumps({
+    "levels": [
+        {"id": "not_started", "name": "Not Started", "score": 0, "description": "No implementation activities"},
+        {"id": "planning", "name": "Planning", "score": 1, "description": "Requirements gathering and planning"},
+        {"id": "pilot", "name": "Pilot", "score": 2, "description": "Limited pilot implementation"},
+        {"id": "partial_implementation", "name": "Partial Implementation", "score": 3, "description": "Deployed in some areas"},
+        {"id": "full_implementation", "name": "Full Implementation", "score": 4, "description": "Organization-wide deployment"},
+        {"id": "optimizing", "name": "Optimizing", "score": 5, "description": "Continuous improvement and optimization"},
+    ]
+})
+
+
 @router.get("/framework")
 async def get_disah_framework():
     """
     Get the WHO DISAH framework structure.
-    
+
     Returns all categories and intervention counts.
     """
-    service = get_digital_health_service()
-    return service.get_framework()
+    return Response(content=_FRAMEWORK_JSON, media_type="application/json")
 
 
 @router.get("/categories/{category_id}")
@@ -81,8 +99,7 @@ async def get_ha_alignment():
     
     Shows how digital health systems support accreditation requirements.
     """
-    service = get_digital_health_service()
-    return {"alignments": service.get_ha_alignment()}
+    return Response(content=_HA_ALIGNMENT_JSON, media_type="application/json")
 
 
 @router.get("/readiness-levels")
@@ -90,15 +107,6 @@ async def get_readiness_levels():
     """
     Get available readiness levels for assessment.
     """
-    return {
-        "levels": [
-            {"id": "not_started", "name": "Not Started", "score": 0, "description": "No implementation activities"},
-            {"id": "planning", "name": "Planning", "score": 1, "description": "Requirements gathering and planning"},
-            {"id": "pilot", "name": "Pilot", "score": 2, "description": "Limited pilot implementation"},
-            {"id": "partial_implementation", "name": "Partial Implementation", "score": 3, "description": "Deployed in some areas"},
-            {"id": "full_implementation", "name": "Full Implementation", "score": 4, "description": "Organization-wide deployment"},
-            {"id": "optimizing", "name": "Optimizing", "score": 5, "description": "Continuous improvement and optimization"},
-        ]
-    }
+    return Response(content=_READINESS_LEVELS_JSON, media_type="application/json")
 
 
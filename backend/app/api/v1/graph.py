@@ -1,5 +1,7 @@
 """Graph API endpoints for standards visualization."""
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -13,23 +15,11 @@ from app.services.standards_service import (
     CriterionCategory,
 )
 
-router = APIRouter(prefix="/graph", tags=["Graph"])
-
-
-class GraphNode(BaseModel):
-    """Node data for Cytoscape.js."""
-    data: Dict[str, Any]
-
-
-class GraphEdge(BaseModel):
-    """Edge data for Cytoscape.js."""
-    data: Dict[str, Any]
-
-
-class GraphData(BaseModel):
-    """Complete graph data for visualization."""
-    nodes: List[GraphNode]
-    edges: List[GraphEdge]
+router = APIRouter(
+    prefix="/graph",
+    tags=["Graph"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class PartSummary(BaseModel):
@@ -67,9 +57,28 @@ class RelationshipDetail(BaseModel):
     mechanism: str
 
 
+# These responses derive entirely from the immutable standards
+# definitions, so the JSON bytes are built once at import time and
+# served as-is on every request.
+# get_graph_data() already returns the Cytoscape.js wire format
+# ({"nodes": [{"data": ...}], "edges": [{"data": ...}]}), so it is
+# serialized as-is without an intermediate pydantic model.
+_STANDARDS_GRAPH_JSON = orjson.dumps(standards_service.get_graph_data())
+_PARTS_JSON = orjson.dumps([
+    PartSummary(
+        number=p.number,
+        name=p.name,
+        weight=p.weight,
+        color=p.color,
+        chapter_count=len(p.chapters),
+    ).model_dump()
+    for p in standards_service.get_parts()
+])
+_STATISTICS_JSON = orjson.dumps(standards_service.get_statistics())
+
+
 @router.get(
     "/standards",
-    response_model=GraphData,
     summary="Get standards graph for visualization"
 )
 async def get_standards_graph(
@@ -77,16 +86,11 @@ async def get_standards_graph(
 ):
     """
     Get the complete HA Thailand Standards graph data formatted for Cytoscape.js.
-    
+
     Returns nodes (chapters) and edges (causal relationships) with all
     necessary data for interactive visualization.
     """
-    graph_data = standards_service.get_graph_data()
-    
-    return GraphData(
-        nodes=[GraphNode(data=n["data"]) for n in graph_data["nodes"]],
-        edges=[GraphEdge(data=e["data"]) for e in graph_data["edges"]]
-    )
+    return Response(content=_STANDARDS_GRAPH_JSON, media_type="application/json")
 
 
 @router.get(
@@ -98,17 +102,7 @@ async def get_parts(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get summary of all standard parts."""
-    parts = standards_service.get_parts()
-    return [
-        PartSummary(
-            number=p.number,
-            name=p.name,
-            weight=p.weight,
-            color=p.color,
-            chapter_count=len(p.chapters)
-        )
-        for p in parts
-    ]
+    return Response(content=_PARTS_JSON, media_type="application/json")
 
 
 @router.get(
@@ -168,19 +162,14 @@ async def get_chapter_detail(
         raise HTTPException(status_code=404, detail=f"Chapter {chapter_id} not found")
     
     # Find the part this chapter belongs to
-    part = None
-    for p in standards_service.get_parts():
-        for c in p.chapters:
-            if c.id == chapter_id:
-                part = p
-                break
-        if part:
-            break
-    
+    part = standards_service.get_part_for_chapter(chapter_id)
+
     # Get relationships
     relationships = standards_service.get_relationships_for_chapter(chapter_id)
     
-    return ChapterDetail(
+    # All fields come from the standards service's own validated models,
+    # so skip re-validation and serialize straight to orjson.
+    detail = ChapterDetail.model_construct(
         id=chapter.id,
         number=chapter.number,
         name=chapter.name,
@@ -193,6 +182,7 @@ async def get_chapter_detail(
         incoming_relationships=relationships["incoming"],
         outgoing_relationships=relationships["outgoing"]
     )
+    return ORJSONResponse(detail.model_dump(mode="json"))
 
 
 @router.get(
@@ -216,19 +206,12 @@ async def get_relationships(
         relationship_type: Filter by type (prerequisite, strong_support, etc.)
         min_strength: Minimum relationship strength (0.0 - 1.0)
     """
-    relationships = standards_service.get_causal_relationships()
-    
-    # Apply filters
-    if source:
-        relationships = [r for r in relationships if r.source == source]
-    if target:
-        relationships = [r for r in relationships if r.target == target]
-    if relationship_type:
-        relationships = [r for r in relationships if r.relationship_type == relationship_type]
-    if min_strength is not None:
-        relationships = [r for r in relationships if r.strength >= min_strength]
-    
-    return relationships
+    return standards_service.filter_relationships(
+        source=source,
+        target=target,
+        relationship_type=relationship_type,
+        min_strength=min_strength,
+    )
 
 
 @router.get(
@@ -242,26 +225,24 @@ async def get_relationship_detail(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get detailed information about a specific causal relationship."""
-    relationships = standards_service.get_causal_relationships()
-    
-    for rel in relationships:
-        if rel.source == source and rel.target == target:
-            source_chapter = standards_service.get_chapter(source)
-            target_chapter = standards_service.get_chapter(target)
-            
-            return RelationshipDetail(
-                source=source,
-                source_name=source_chapter.name if source_chapter else source,
-                target=target,
-                target_name=target_chapter.name if target_chapter else target,
-                strength=rel.strength,
-                relationship_type=rel.relationship_type,
-                mechanism=rel.mechanism
-            )
-    
-    raise HTTPException(
-        status_code=404,
-        detail=f"Relationship from {source} to {target} not found"
+    rel = standards_service.get_relationship(source, target)
+    if not rel:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Relationship from {source} to {target} not found"
+        )
+
+    source_chapter = standards_service.get_chapter(source)
+    target_chapter = standards_service.get_chapter(target)
+
+    return RelationshipDetail.model_construct(
+        source=source,
+        source_name=source_chapter.name if source_chapter else source,
+        target=target,
+        target_name=target_chapter.name if target_chapter else target,
+        strength=rel.strength,
+        relationship_type=rel.relationship_type,
+        mechanism=rel.mechanism
     )
 
 
@@ -304,46 +285,6 @@ async def get_graph_statistics(
     current_user: dict = Depends(get_current_user_with_role)
 ):
     """Get statistics about the standards graph."""
-    parts = standards_service.get_parts()
-    chapters = standards_service.get_all_chapters()
-    criteria = standards_service.get_all_criteria()
-    relationships = standards_service.get_causal_relationships()
-    
-    essential_count = sum(1 for c in criteria if c.category == CriterionCategory.ESSENTIAL)
-    core_count = sum(1 for c in criteria if c.category == CriterionCategory.CORE)
-    basic_count = sum(1 for c in criteria if c.category == CriterionCategory.BASIC)
-    
-    # Calculate average relationship strength
-    avg_strength = sum(r.strength for r in relationships) / len(relationships) if relationships else 0
-    
-    # Group relationships by type
-    rel_by_type = {}
-    for r in relationships:
-        rel_by_type[r.relationship_type] = rel_by_type.get(r.relationship_type, 0) + 1
-    
-    return {
-        "parts": len(parts),
-        "chapters": len(chapters),
-        "criteria": {
-            "total": len(criteria),
-            "essential": essential_count,
-            "core": core_count,
-            "basic": basic_count,
-        },
-        "relationships": {
-            "total": len(relationships),
-            "average_strength": round(avg_strength, 3),
-            "by_type": rel_by_type,
-        },
-        "parts_detail": [
-            {
-                "number": p.number,
-                "name": p.name,
-                "chapters": len(p.chapters),
-                "criteria": sum(len(c.criteria) for c in p.chapters),
-            }
-            for p in parts
-        ]
-    }
+    return Response(content=_STATISTICS_JSON, media_type="application/json")
 
 
@@ -1,9 +1,13 @@
 """Hospital API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import json
+
+import numpy as np
+import orjson
 
 from app.core.security import get_current_user_with_role
 from app.models.hospital import Hospital, HospitalType, Ownership, Region
@@ -11,7 +15,28 @@ from app.models.assessment import Assessment, CriterionScore, AccreditationLevel
 from app.services.hospital_service import hospital_service
 from app.services.assessment_service import assessment_service
 
-router = APIRouter(prefix="/hospitals", tags=["Hospitals"])
+router = APIRouter(
+    prefix="/hospitals",
+    tags=["Hospitals"],
+    default_response_class=ORJSONResponse,
+)
+
+# Accreditation bands: <2.5 not_accredited, then pass / good /
+# very_good / excellent at 2.5 / 3.0 / 3.5 / 4.0.
+_LEVEL_THRESHOLDS = np.array([2.5, 3.0, 3.5, 4.0])
+_LEVELS = (
+    AccreditationLevel.NOT_ACCREDITED,
+    AccreditationLevel.PASS,
+    AccreditationLevel.GOOD,
+    AccreditationLevel.VERY_GOOD,
+    AccreditationLevel.EXCELLENT,
+)
+
+# Value-to-member maps for converting uploaded strings to enums with a
+# dict lookup instead of an exception-driven constructor call
+_HOSPITAL_TYPE_MAP = {e.value: e for e in HospitalType}
+_REGION_MAP = {e.value: e for e in Region}
+_OWNERSHIP_MAP = {e.value: e for e in Ownership}
 
 
 class HospitalCreate(BaseModel):
@@ -72,30 +97,42 @@ class HospitalSummary(BaseModel):
     summary="Get all hospitals"
 )
 async def get_hospitals(
+    request: Request,
     name: Optional[str] = Query(None, description="Filter by name"),
     hospital_type: Optional[HospitalType] = Query(None, description="Filter by type"),
     region: Optional[Region] = Query(None, description="Filter by region"),
     ownership: Optional[Ownership] = Query(None, description="Filter by ownership"),
     min_beds: Optional[int] = Query(None, description="Minimum bed count"),
     max_beds: Optional[int] = Query(None, description="Maximum bed count"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    offset: int = Query(0, ge=0, description="Rows to skip"),
     current_user: dict = Depends(get_current_user_with_role)
 ):
-    """Get all hospitals with optional filters."""
-    hospitals = hospital_service.search(
+    """Get all hospitals with optional filters, paginated."""
+    # The service joins each hospital with its latest assessment and
+    # count in one pass, so the endpoint just maps rows to summaries;
+    # pagination caps the worst-case cost as the dataset grows
+    rows, total = hospital_service.search_with_stats(
         name=name,
         hospital_type=hospital_type,
         region=region,
         ownership=ownership,
         min_beds=min_beds,
         max_beds=max_beds,
+        limit=limit,
+        offset=offset,
     )
-    
-    # Build summaries with assessment info
+
+    # The list only changes when a hospital or assessment is written, so
+    # polling clients can be answered with a 304 before any summaries
+    # are built or serialized. The page bounds shape the payload, so
+    # they are part of the ETag.
+    etag = _hospitals_etag(rows, limit, offset, total)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
     summaries = []
-    for h in hospitals:
-        latest = assessment_service.get_latest_by_hospital(h.id)
-        assessments = assessment_service.get_by_hospital(h.id)
-        
+    for h, latest, assessment_count in rows:
         summaries.append(HospitalSummary(
             id=h.id,
             name=h.name,
@@ -107,10 +144,26 @@ async def get_hospitals(
             current_accreditation_level=latest.accreditation_level.value if latest else None,
             latest_assessment_date=latest.assessment_date.isoformat() if latest else None,
             latest_maturity_score=latest.overall_maturity_score if latest else None,
-            assessment_count=len(assessments),
+            assessment_count=assessment_count,
         ))
-    
-    return summaries
+
+    return ORJSONResponse(
+        [s.model_dump(mode="json") for s in summaries],
+        headers={"ETag": etag, "X-Total-Count": str(total)},
+    )
+
+
+def _hospitals_etag(rows, limit: int, offset: int, total: int) -> str:
+    """Build a weak ETag from the newest write times and the page bounds."""
+    if not rows:
+        return f'W/"empty-{limit}-{offset}-{total}"'
+    newest_h = max(h.updated_at for h, _, _ in rows)
+    newest_a = max(
+        (latest.updated_at for _, latest, _ in rows if latest),
+        default=None,
+    )
+    a_part = newest_a.timestamp() if newest_a else 0
+    return f'W/"{newest_h.timestamp()}-{a_part}-{limit}-{offset}-{total}"'
 
 
 @router.get(
@@ -151,7 +204,9 @@ async def create_hospital(
 ):
     """Create a new hospital."""
     hospital = Hospital(**data.model_dump())
-    return hospital_service.create(hospital)
+    # Mutations persist to the JSON store; run them off the event loop so
+    # the file write does not stall other in-flight requests.
+    return await run_in_threadpool(hospital_service.create, hospital)
 
 
 @router.patch(
@@ -166,7 +221,7 @@ async def update_hospital(
 ):
     """Update a hospital's information."""
     updates = {k: v for k, v in data.model_dump().items() if v is not None}
-    hospital = hospital_service.update(hospital_id, updates)
+    hospital = await run_in_threadpool(hospital_service.update, hospital_id, updates)
     if not hospital:
         raise HTTPException(status_code=404, detail="Hospital not found")
     return hospital
@@ -182,10 +237,12 @@ async def delete_hospital(
 ):
     """Delete a hospital and all its assessments."""
     # Delete associated assessments first
-    deleted_assessments = assessment_service.delete_by_hospital(hospital_id)
-    
+    deleted_assessments = await run_in_threadpool(
+        assessment_service.delete_by_hospital, hospital_id
+    )
+
     # Delete hospital
-    success = hospital_service.delete(hospital_id)
+    success = await run_in_threadpool(hospital_service.delete, hospital_id)
     if not success:
         raise HTTPException(status_code=404, detail="Hospital not found")
     
@@ -205,6 +262,11 @@ class UploadResult(BaseModel):
     errors: List[str] = []
 
 
+def _parse_upload_json(file: UploadFile):
+    """Read the spooled upload and parse it, inside the worker thread."""
+    return orjson.loads(file.file.read())
+
+
 @router.post(
     "/upload",
     response_model=UploadResult,
@@ -249,13 +311,14 @@ async def upload_hospital_data(
         )
     
     try:
-        content = await file.read()
-        
         if filename.lower().endswith('.json'):
-            # Parse JSON
+            # Starlette spools large uploads to disk already; read and
+            # parse in one threadpool hop so the raw byte buffer is
+            # freed as soon as the parse finishes instead of living in
+            # this frame for the rest of the import
             try:
-                data = json.loads(content.decode('utf-8'))
-            except json.JSONDecodeError as e:
+                data = await run_in_threadpool(_parse_upload_json, file)
+            except orjson.JSONDecodeError as e:
                 raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
         else:
             # Excel parsing would require openpyxl
@@ -286,21 +349,18 @@ async def upload_hospital_data(
             ownership_str = hospital_data.get("ownership", "Public")
             
             # Map string values to enums
-            try:
-                h_type = HospitalType(hospital_type_str)
-            except ValueError:
+            h_type = _HOSPITAL_TYPE_MAP.get(hospital_type_str)
+            if h_type is None:
                 h_type = HospitalType.GENERAL
                 errors.append(f"Unknown hospital type '{hospital_type_str}', defaulting to General")
-            
-            try:
-                h_region = Region(region_str)
-            except ValueError:
+
+            h_region = _REGION_MAP.get(region_str)
+            if h_region is None:
                 h_region = Region.CENTRAL
                 errors.append(f"Unknown region '{region_str}', defaulting to Central")
-            
-            try:
-                h_ownership = Ownership(ownership_str)
-            except ValueError:
+
+            h_ownership = _OWNERSHIP_MAP.get(ownership_str)
+            if h_ownership is None:
                 h_ownership = Ownership.PUBLIC
                 errors.append(f"Unknown ownership '{ownership_str}', defaulting to Public")
             
@@ -314,65 +374,91 @@ async def upload_hospital_data(
                 province=hospital_data.get("province"),
                 address=hospital_data.get("address"),
             )
-            hospital = hospital_service.create(hospital)
+            hospital = await run_in_threadpool(hospital_service.create, hospital)
             result_msg = f"Created new hospital: {hospital.name}"
         
-        # Process assessments
-        assessments_imported = 0
+        # Process assessments, accumulating rows so the store is written
+        # once for the whole batch rather than once per assessment
+        pending: List[Assessment] = []
+        flat_scores: List[float] = []
+        score_counts: List[int] = []
+        # Shared fallback date: rows without an assessment_date all get
+        # the same imported-at timestamp instead of one clock call each
+        default_date = datetime.now()
         for a_data in assessments_data:
             try:
-                # Parse assessment date
+                # Parse assessment date; fromisoformat is C-implemented
+                # and fast, so only pay for the Z-suffix rewrite (which it
+                # predates) when the string actually ends with one
                 a_date_str = a_data.get("assessment_date", "")
                 if a_date_str:
-                    a_date = datetime.fromisoformat(a_date_str.replace('Z', '+00:00'))
+                    if a_date_str[-1] in 'Zz':
+                        a_date_str = a_date_str[:-1] + '+00:00'
+                    a_date = datetime.fromisoformat(a_date_str)
                 else:
-                    a_date = datetime.now()
+                    a_date = default_date
                 
-                # Parse criterion scores
-                scores = []
-                for cs in a_data.get("criterion_scores", []):
-                    score_val = cs.get("score", 0)
-                    if not (1.0 <= score_val <= 5.0):
-                        errors.append(f"Score {score_val} out of range (1-5) for criterion {cs.get('criterion_id')}")
-                        continue
-                    
-                    scores.append(CriterionScore(
+                # Parse criterion scores: validate once, then build the
+                # score objects in a comprehension (LIST_APPEND bytecode
+                # beats method-call appends on large rows)
+                raw_scores = a_data.get("criterion_scores", ())
+                valid = [cs for cs in raw_scores if 1.0 <= cs.get("score", 0) <= 5.0]
+                if len(valid) != len(raw_scores):
+                    errors.extend(
+                        f"Score {cs.get('score', 0)} out of range (1-5) for criterion {cs.get('criterion_id')}"
+                        for cs in raw_scores
+                        if not (1.0 <= cs.get("score", 0) <= 5.0)
+                    )
+                scores = [
+                    CriterionScore(
                         criterion_id=cs.get("criterion_id", ""),
-                        score=score_val,
+                        score=cs["score"],
                         evidence=cs.get("notes") or cs.get("evidence"),
                         notes=cs.get("notes"),
-                    ))
-                
-                # Calculate overall score (simple average for now)
-                if scores:
-                    overall_score = sum(s.score for s in scores) / len(scores)
-                else:
-                    overall_score = 0
-                
-                # Determine accreditation level
-                if overall_score >= 4.0:
-                    level = AccreditationLevel.EXCELLENT
-                elif overall_score >= 3.5:
-                    level = AccreditationLevel.VERY_GOOD
-                elif overall_score >= 3.0:
-                    level = AccreditationLevel.GOOD
-                elif overall_score >= 2.5:
-                    level = AccreditationLevel.PASS
-                else:
-                    level = AccreditationLevel.NOT_PASSED
+                    )
+                    for cs in valid
+                ]
                 
+                # Overall scores and levels are computed for the whole
+                # batch below; the loop just collects the raw values
                 assessment = Assessment(
                     hospital_id=hospital.id,
                     assessment_date=a_date,
-                    overall_maturity_score=round(overall_score, 2),
-                    accreditation_level=level,
                     criterion_scores=scores,
                 )
-                assessment_service.create(assessment)
-                assessments_imported += 1
-                
+                pending.append(assessment)
+                flat_scores.extend(s.score for s in scores)
+                score_counts.append(len(scores))
+
             except Exception as e:
                 errors.append(f"Error importing assessment: {str(e)}")
+
+        # Compute every row's overall score (simple average for now) as
+        # one segmented reduction over the flattened score array, then
+        # classify accreditation levels with a single vectorized
+        # threshold search instead of per-row Python sums and branches
+        if pending:
+            counts = np.asarray(score_counts, dtype=np.int64)
+            means = np.zeros(len(pending), dtype=np.float32)
+            if flat_scores:
+                flat = np.asarray(flat_scores, dtype=np.float32)
+                offsets = np.zeros(len(pending), dtype=np.int64)
+                np.cumsum(counts[:-1], out=offsets[1:])
+                # Reduce only over rows that have scores; empty rows
+                # contribute no elements, so dropping their offsets keeps
+                # every remaining segment boundary correct
+                nonempty = counts > 0
+                sums = np.add.reduceat(flat, offsets[nonempty])
+                means[nonempty] = sums / counts[nonempty]
+
+            level_idx = np.searchsorted(_LEVEL_THRESHOLDS, means, side="right")
+            for assessment, mean, idx in zip(pending, means, level_idx):
+                assessment.overall_maturity_score = round(float(mean), 2)
+                assessment.accreditation_level = _LEVELS[idx]
+
+        assessments_imported = await run_in_threadpool(
+            assessment_service.bulk_create, pending
+        )
         
         return UploadResult(
             success=True,
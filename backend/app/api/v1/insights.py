@@ -3,27 +3,79 @@ AI Insights API endpoints.
 Provides AI-generated insights and recommendations for quality improvement.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
+from app.core.cache import ttl_cache
+from app.services.assessment_service import assessment_service
 from app.services.insights_service import get_insights_service
 
-router = APIRouter(prefix="/insights", tags=["insights"])
+router = APIRouter(
+    prefix="/insights",
+    tags=["insights"],
+    default_response_class=ORJSONResponse,
+)
+
+# Resolve the singleton once at import instead of per request
+_insights_service = get_insights_service()
+
+
+@ttl_cache(ttl_seconds=300)
+def _cached_insights(hospital_id: str, data_version: str):
+    """Generate (or reuse) the full insights payload for a hospital."""
+    return _insights_service.generate_insights(hospital_id)
+
+
+def _insights_version(hospital_id: str) -> str:
+    """Version token for a hospital's insights: its newest assessment write."""
+    newest = assessment_service.latest_updated_at(hospital_id)
+    return str(newest.timestamp()) if newest else "empty"
+
+
+def _insights_etag(hospital_id: str, version: str) -> str:
+    """Build a weak ETag from the hospital and its insights version."""
+    return f'W/"{hospital_id}-{version}"'
+
+
+def _get_insights(hospital_id: str, version: Optional[str] = None):
+    """
+    Get insights through the cache.
+
+    The cache key carries the newest assessment updated_at, so any write
+    for the hospital changes the key and the next read recomputes; the
+    TTL only bounds staleness of the version probe itself. When a
+    frontend loads the insights, summary, risk and recommendation panels
+    together, only the first request pays for generation.
+    """
+    if version is None:
+        version = _insights_version(hospital_id)
+    return _cached_insights(hospital_id, version)
 
 
 @router.get("")
 async def get_insights(
+    request: Request,
     hospital_id: str = Query(default="hosp-001", description="Hospital ID to generate insights for"),
 ):
     """
     Generate comprehensive AI insights for a hospital.
-    
+
     Returns gap analysis, trend analysis, risk assessment,
     root cause analysis, benchmarks, and prioritized recommendations.
     """
-    service = get_insights_service()
-    insights = service.generate_insights(hospital_id)
-    return insights
+    # Insights only change when an assessment is written, so polling
+    # clients can be served a 304 without generation or serialization.
+    version = _insights_version(hospital_id)
+    etag = _insights_etag(hospital_id, version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Generation walks the whole assessment history; keep cache misses
+    # off the event loop
+    full_insights = await run_in_threadpool(_get_insights, hospital_id, version)
+    return ORJSONResponse(full_insights, headers={"ETag": etag})
 
 
 @router.get("/categories")
@@ -33,79 +85,94 @@ async def get_insight_categories():
     
     Returns a list of category definitions with icons for UI rendering.
     """
-    service = get_insights_service()
     return {
-        "categories": service.get_insight_categories()
+        "categories": _insights_service.get_insight_categories()
     }
 
 
 @router.get("/summary")
 async def get_insights_summary(
+    request: Request,
     hospital_id: str = Query(default="hosp-001", description="Hospital ID"),
 ):
     """
     Get a brief summary of insights.
-    
+
     Returns only summary statistics without full insight details.
     Useful for dashboard widgets.
     """
-    service = get_insights_service()
-    full_insights = service.generate_insights(hospital_id)
-    
-    return {
+    version = _insights_version(hospital_id)
+    etag = _insights_etag(hospital_id, version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    full_insights = await run_in_threadpool(_get_insights, hospital_id, version)
+
+    return ORJSONResponse(headers={"ETag": etag}, content={
         "hospital_id": hospital_id,
         "generated_at": full_insights["generated_at"],
         "risk_score": full_insights["risk_score"],
         "risk_level": full_insights["risk_level"],
         "summary": full_insights["summary"],
         "top_recommendations": full_insights["recommendations"][:3] if full_insights["recommendations"] else [],
-    }
+    })
 
 
 @router.get("/risk-assessment")
 async def get_risk_assessment(
+    request: Request,
     hospital_id: str = Query(default="hosp-001", description="Hospital ID"),
 ):
     """
     Get detailed risk assessment.
-    
+
     Returns risk score, risk level, and risk-related insights.
     """
-    service = get_insights_service()
-    full_insights = service.generate_insights(hospital_id)
-    
+    version = _insights_version(hospital_id)
+    etag = _insights_etag(hospital_id, version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    full_insights = await run_in_threadpool(_get_insights, hospital_id, version)
+
     risk_insights = [
         i for i in full_insights["insights"]
         if i.get("category") == "risk_assessment"
     ]
-    
-    return {
+
+    return ORJSONResponse(headers={"ETag": etag}, content={
         "hospital_id": hospital_id,
         "risk_score": full_insights["risk_score"],
         "risk_level": full_insights["risk_level"],
         "risk_insights": risk_insights,
         "critical_count": full_insights["summary"]["by_priority"].get("critical", 0),
         "high_count": full_insights["summary"]["by_priority"].get("high", 0),
-    }
+    })
 
 
 @router.get("/recommendations")
 async def get_recommendations(
+    request: Request,
     hospital_id: str = Query(default="hosp-001", description="Hospital ID"),
     limit: int = Query(default=10, ge=1, le=20, description="Maximum recommendations to return"),
 ):
     """
     Get prioritized improvement recommendations.
-    
+
     Returns a ranked list of actionable recommendations.
     """
-    service = get_insights_service()
-    full_insights = service.generate_insights(hospital_id)
-    
-    return {
+    version = _insights_version(hospital_id)
+    # The limit shapes the payload, so it has to be part of the ETag
+    etag = f'W/"{hospital_id}-{limit}-{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    full_insights = await run_in_threadpool(_get_insights, hospital_id, version)
+
+    return ORJSONResponse(headers={"ETag": etag}, content={
         "hospital_id": hospital_id,
         "recommendations": full_insights["recommendations"][:limit],
         "total_available": len(full_insights["recommendations"]),
-    }
+    })
 
 
@@ -3,12 +3,20 @@ ISQua EEA Integration API endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, List
 
 from app.services.isqua_service import get_isqua_service
 
-router = APIRouter(prefix="/isqua", tags=["isqua"])
+router = APIRouter(
+    prefix="/isqua",
+    tags=["isqua"],
+    default_response_class=ORJSONResponse,
+)
+
+# Resolve the singleton once at import instead of per request
+_isqua_service = get_isqua_service()
 
 
 class ISQuaAssessmentRequest(BaseModel):
@@ -16,6 +24,11 @@ class ISQuaAssessmentRequest(BaseModel):
     ha_chapter_scores: Dict[str, float]
 
 
+class BatchConversionRequest(BaseModel):
+    """Request for batch HA to ISQua conversion."""
+    ha_scores: List[float]
+
+
 @router.get("/principles")
 async def get_isqua_principles():
     """
@@ -23,8 +36,7 @@ async def get_isqua_principles():
     
     Returns all principles with their focus areas and HA mappings.
     """
-    service = get_isqua_service()
-    return {"principles": service.get_principles()}
+    return {"principles": _isqua_service.get_principles()}
 
 
 @router.get("/principles/{principle_id}")
@@ -32,8 +44,7 @@ async def get_principle_details(principle_id: str):
     """
     Get detailed information about an ISQua principle.
     """
-    service = get_isqua_service()
-    principle = service.get_principle(principle_id)
+    principle = _isqua_service.get_principle(principle_id)
     
     if not principle:
         raise HTTPException(status_code=404, detail="Principle not found")
@@ -48,8 +59,7 @@ async def get_ha_to_isqua_mapping():
     
     Shows alignment strength and notes for each mapping.
     """
-    service = get_isqua_service()
-    return {"mapping": service.get_ha_to_isqua_mapping()}
+    return {"mapping": _isqua_service.get_ha_to_isqua_mapping()}
 
 
 @router.post("/assess")
@@ -59,8 +69,7 @@ async def assess_isqua_compliance(request: ISQuaAssessmentRequest):
     
     Converts HA scores to ISQua ratings and provides principle-level analysis.
     """
-    service = get_isqua_service()
-    return service.full_isqua_assessment(request.ha_chapter_scores)
+    return _isqua_service.full_isqua_assessment(request.ha_chapter_scores)
 
 
 @router.post("/assess/{principle_id}")
@@ -71,8 +80,7 @@ async def assess_single_principle(
     """
     Assess compliance with a single ISQua principle.
     """
-    service = get_isqua_service()
-    result = service.assess_principle_compliance(
+    result = _isqua_service.assess_principle_compliance(
         principle_id,
         request.ha_chapter_scores,
     )
@@ -94,8 +102,7 @@ async def convert_ha_to_isqua(
     HA 2.0-3.9 → ISQua 2 (Partially meets)
     HA 4.0-5.0 → ISQua 3 (Fully meets)
     """
-    service = get_isqua_service()
-    isqua_rating = service.convert_ha_score_to_isqua(ha_score)
+    isqua_rating = _isqua_service.convert_ha_score_to_isqua(ha_score)
     
     rating_texts = {
         1: "Does not meet criterion",
@@ -110,6 +117,17 @@ async def convert_ha_to_isqua(
     }
 
 
+@router.post("/convert/ha-to-isqua/batch")
+async def convert_ha_to_isqua_batch(request: BatchConversionRequest):
+    """
+    Convert a list of HA Thailand scores to ISQua ratings in one call.
+
+    The conversion runs as a single vectorized pass, so bulk workloads
+    avoid one request (and one Python branch chain) per score.
+    """
+    return {"isqua_ratings": _isqua_service.convert_batch(request.ha_scores)}
+
+
 @router.get("/convert/isqua-to-ha")
 async def convert_isqua_to_ha(
     isqua_rating: int = Query(..., ge=1, le=3, description="ISQua rating (1-3)"),
@@ -121,8 +139,7 @@ async def convert_isqua_to_ha(
     ISQua 2 → HA ~2.5
     ISQua 3 → HA ~4.5
     """
-    service = get_isqua_service()
-    ha_score = service.convert_isqua_to_ha_score(isqua_rating)
+    ha_score = _isqua_service.convert_isqua_to_ha_score(isqua_rating)
     
     return {
         "isqua_rating": isqua_rating,
@@ -3,14 +3,49 @@ Reports API endpoints.
 Provides PDF report generation and download.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from io import BytesIO
+from functools import lru_cache
 
-from app.services.report_service import get_report_service
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.cache import ttl_cache
+from app.services.assessment_service import assessment_service
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+# The report service pulls in ReportLab, which is by far the heaviest
+# transitive import of the API package; resolve it on first use so app
+# startup (and liveness probes) don't pay for it.
+
+
+@lru_cache(maxsize=1)
+def _available_report_ids() -> frozenset:
+    """The static set of report ids, resolved on first use."""
+    from app.services.report_service import get_report_service
+
+    return frozenset(r["id"] for r in get_report_service().get_available_reports())
+
+
+@ttl_cache(ttl_seconds=3600, maxsize=64)
+def _cached_pdf(hospital_id: str, report_type: str, data_version: str) -> bytes:
+    """Generate (or reuse) the PDF bytes for a report."""
+    from app.services.report_service import get_report_service
+
+    return get_report_service().generate_report(hospital_id, report_type)
+
+
+def _get_report_pdf(hospital_id: str, report_type: str) -> bytes:
+    """
+    Get a report PDF through the cache.
+
+    Same download/preview pairs arrive within minutes of each other, and
+    rendering is the expensive part. The cache key carries the
+    hospital's newest assessment updated_at, so any write rolls the key
+    and the next request re-renders.
+    """
+    version = assessment_service.latest_updated_at(hospital_id)
+    return _cached_pdf(hospital_id, report_type, str(version))
+
 
 @router.get("/types")
 async def get_report_types():
@@ -19,9 +54,10 @@ async def get_report_types():
     
     Returns a list of report types with descriptions.
     """
-    service = get_report_service()
+    from app.services.report_service import get_report_service
+
     return {
-        "report_types": service.get_available_reports()
+        "report_types": get_report_service().get_available_reports()
     }
 
 
@@ -35,24 +71,24 @@ async def generate_report(
     
     Returns the generated PDF as a downloadable file.
     """
-    service = get_report_service()
-    
     # Validate report type
-    available_types = [r["id"] for r in service.get_available_reports()]
-    if report_type not in available_types:
+    if report_type not in _available_report_ids():
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid report type. Available types: {available_types}"
+            detail=f"Invalid report type. Available types: {sorted(_available_report_ids())}"
         )
-    
+
     try:
-        pdf_bytes = service.generate_report(hospital_id, report_type)
-        
+        # PDF rendering is CPU-bound; keep it off the event loop
+        pdf_bytes = await run_in_threadpool(_get_report_pdf, hospital_id, report_type)
+
         # Create filename
         filename = f"ha-cie-{report_type.replace('_', '-')}-{hospital_id}.pdf"
-        
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+
+        # The PDF bytes are already fully built; hand them to the
+        # response as-is instead of copying them into a BytesIO wrapper
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -75,21 +111,19 @@ async def preview_report(
     
     Returns the PDF for inline viewing in browser.
     """
-    service = get_report_service()
-    
     # Validate report type
-    available_types = [r["id"] for r in service.get_available_reports()]
-    if report_type not in available_types:
+    if report_type not in _available_report_ids():
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid report type. Available types: {available_types}"
+            detail=f"Invalid report type. Available types: {sorted(_available_report_ids())}"
         )
-    
+
     try:
-        pdf_bytes = service.generate_report(hospital_id, report_type)
-        
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        # PDF rendering is CPU-bound; keep it off the event loop
+        pdf_bytes = await run_in_threadpool(_get_report_pdf, hospital_id, report_type)
+
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": "inline"
@@ -0,0 +1,35 @@
+"""Simple in-process caching utilities."""
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+
+def ttl_cache(ttl_seconds: float = 3600, maxsize: int = 1024) -> Callable:
+    """
+    Decorator that caches a function's results in-process with a TTL.
+
+    Results are keyed by the call arguments, which must be hashable.
+    Intended for read-heavy lookups whose inputs are low-cardinality and
+    whose underlying data only changes between deploys.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl_seconds:
+                return hit[1]
+
+            result = func(*args, **kwargs)
+            if len(cache) >= maxsize:
+                cache.clear()
+            cache[key] = (now, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -27,6 +27,10 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24  # 24 hours
 
+    # Password hashing cost; lower on dev machines where the default
+    # 12-round Blowfish schedule dominates login latency
+    bcrypt_rounds: int = 12
+
     model_config = {
         "env_file": ".env",
         "extra": "ignore",
@@ -1,13 +1,14 @@
 """Security utilities for authentication and authorization."""
-from datetime import datetime, timedelta
-from typing import Optional, List
+from datetime import timedelta
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
 import hashlib
 import secrets
+import time
 
-from jose import JWTError, jwt
+import jwt
 import bcrypt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
@@ -33,7 +34,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
@@ -41,38 +42,95 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create a JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        expire = int(time.time() + settings.access_token_expire_minutes * 60)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
+# Verified-token cache: token -> (cache expiry epoch seconds, payload).
+# Every endpoint decodes the bearer token, so caching the HMAC
+# verification amortizes the crypto work across requests from the same
+# user. Entries never outlive the token's own exp claim.
+_token_cache: Dict[str, Tuple[float, dict]] = {}
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 8192
+
+
 def decode_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT token."""
+    now = time.time()
+    hit = _token_cache.get(token)
+    if hit is not None:
+        if now < hit[0]:
+            return hit[1]
+        del _token_cache[token]
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
+    cache_until = now + _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        cache_until = min(cache_until, float(exp))
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    _token_cache[token] = (cache_until, payload)
+    return payload
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    """Get the current authenticated user from the JWT token."""
-    token = credentials.credentials
+
+def _decode_cached(request: Request, token: str) -> Optional[dict]:
+    """
+    Decode a token with a per-request memo.
+
+    Endpoints that chain several security dependencies (e.g. a role
+    check plus the current user) would otherwise decode the same token
+    once per dependency; the first decode in a request is stashed on
+    request.state and reused by the rest of the chain.
+    """
+    cached = getattr(request.state, "_jwt_payload", None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
     payload = decode_token(token)
+    request.state._jwt_payload = (token, payload)
+    return payload
+
+
+async def _token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """
+    Extract the bearer token from the Authorization header.
 
+    FastAPI caches dependency results per request, so routes that stack
+    several security dependencies parse the header once and share the
+    token string instead of re-running the HTTPBearer scheme each time.
+    """
+    return credentials.credentials
+
+
+def _require_payload(request: Request, token: str) -> dict:
+    """Decode the token, raising 401 if it is missing or invalid."""
+    payload = _decode_cached(request, token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-
     return payload
 
 
+async def get_current_user(
+    request: Request,
+    token: str = Depends(_token),
+) -> dict:
+    """Get the current authenticated user from the JWT token."""
+    return _require_payload(request, token)
+
+
 def generate_session_token() -> str:
     """Generate a secure random session token."""
     return secrets.token_urlsafe(32)
@@ -89,18 +147,14 @@ def require_role(allowed_roles: List[UserRole]):
         ):
             ...
     """
+    # Resolved once when the dependency is built, not per request
+    allowed = frozenset(role.value for role in allowed_roles)
+
     async def role_checker(
-        credentials: HTTPAuthorizationCredentials = Depends(security)
+        request: Request,
+        token: str = Depends(_token),
     ) -> dict:
-        token = credentials.credentials
-        payload = decode_token(token)
-
-        if payload is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        payload = _require_payload(request, token)
 
         user_role = payload.get("role")
         if user_role is None:
@@ -110,7 +164,7 @@ def require_role(allowed_roles: List[UserRole]):
             )
 
         # Check if user's role is in the allowed roles
-        if user_role not in [role.value for role in allowed_roles]:
+        if user_role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You do not have permission to access this resource",
@@ -127,17 +181,8 @@ def require_qi_team():
 
 
 async def get_current_user_with_role(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    request: Request,
+    token: str = Depends(_token),
 ) -> dict:
     """Get the current authenticated user with role information."""
-    token = credentials.credentials
-    payload = decode_token(token)
-
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    return payload
+    return _require_payload(request, token)
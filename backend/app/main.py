@@ -1,6 +1,7 @@
 """Main FastAPI application entry point."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api.v1 import auth, causal, graph, hospitals, assessments, dashboard, simulations, timeline, insights, reports, digital_health, isqua
@@ -9,6 +10,7 @@ app = FastAPI(
     title=settings.app_name,
     description="API for hospital accreditation analytics and causal inference",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -38,6 +40,24 @@ app.include_router(digital_health.router, prefix="/api/v1")
 app.include_router(isqua.router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+async def warm_scoring_path():
+    """Run one throwaway scoring pass so the first real request doesn't
+    pay for lazy imports, scratch-buffer setup and NumPy ufunc
+    initialization."""
+    from datetime import date
+
+    from app.models.assessment import Assessment
+
+    warmup = Assessment(
+        hospital_id="warmup",
+        assessment_date=date.today(),
+        assessment_cycle="warmup",
+    )
+    warmup.calculate_scores(None)
+    Assessment.calculate_scores_batch([warmup])
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
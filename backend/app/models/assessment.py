@@ -2,9 +2,31 @@
 from datetime import datetime, date
 from typing import Optional, List, Dict
 from enum import Enum
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+import threading
 import uuid
 
+import numpy as np
+
+# Per-thread scratch buffers for calculate_scores, keyed by the score
+# index they were sized for. Scoring runs in threadpool workers, so each
+# thread reuses its own buffers instead of allocating fresh arrays per
+# call.
+_scoring_scratch = threading.local()
+
+
+def _get_scratch(index):
+    """Get (chapter_avg, weighted) scratch arrays for this thread."""
+    entry = getattr(_scoring_scratch, "entry", None)
+    if entry is None or entry[0] is not index:
+        entry = (
+            index,
+            np.zeros(index.n_chapters),
+            np.zeros(index.n_chapters),
+        )
+        _scoring_scratch.entry = entry
+    return entry[1], entry[2]
+
 
 class AccreditationLevel(str, Enum):
     """Accreditation levels based on HA Thailand standards."""
@@ -15,6 +37,30 @@ class AccreditationLevel(str, Enum):
     EXCELLENT = "excellent"    # Score 4.0+
 
 
+# Level boundaries in ascending order; searchsorted with side="right"
+# maps a score to its slot in _LEVELS, preserving the >= semantics of
+# the old comparison ladder.
+def _r2(x: float) -> float:
+    """
+    Round a non-negative score to two decimals.
+
+    Plain integer math is several times faster than the builtin round,
+    which goes through banker's-rounding machinery; scores are always
+    >= 0 so the +0.5 truncation trick is safe here.
+    """
+    return int(x * 100 + 0.5) / 100
+
+
+_THRESHOLDS = np.array([2.5, 3.0, 3.5, 4.0])
+_LEVELS = (
+    AccreditationLevel.NOT_ACCREDITED,
+    AccreditationLevel.PASS,
+    AccreditationLevel.GOOD,
+    AccreditationLevel.VERY_GOOD,
+    AccreditationLevel.EXCELLENT,
+)
+
+
 class CriterionScore(BaseModel):
     """Score for a single criterion."""
     criterion_id: str
@@ -60,6 +106,7 @@ class Assessment(BaseModel):
     
     # Calculated scores (stored for quick access)
     part_scores: Dict[str, float] = {}  # {"I": 3.2, "II": 3.5, ...}
+    chapter_scores: Dict[str, float] = {}  # {"I-1": 3.4, "II-4": 2.9, ...}
     overall_maturity_score: Optional[float] = None
     accreditation_level: AccreditationLevel = AccreditationLevel.NOT_ACCREDITED
     
@@ -76,7 +123,41 @@ class Assessment(BaseModel):
     notes: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
-    
+
+    # Lazily built criterion_id -> score map, shared by every consumer
+    # that needs point lookups into criterion_scores.
+    _score_lookup: Optional[Dict[str, float]] = PrivateAttr(default=None)
+    # Dense score vector aligned with the standards service's global
+    # criterion index; NaN marks unassessed criteria.
+    _scores_np: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    def get_score_lookup(self) -> Dict[str, float]:
+        """Get the criterion_id -> score map, building it at most once."""
+        if self._score_lookup is None:
+            self._score_lookup = {cs.criterion_id: cs.score for cs in self.criterion_scores}
+        return self._score_lookup
+
+    def get_scores_array(self) -> np.ndarray:
+        """Get the dense criterion-score vector, building it at most once."""
+        if self._scores_np is None:
+            from app.services.standards_service import standards_service as std_svc
+
+            index = std_svc.get_criterion_index()
+            # float64, so averages that land on a .xx5 rounding tie come
+            # out the same here as in the scalar dict-based path
+            scores = np.full(len(index), np.nan, dtype=np.float64)
+            for cs in self.criterion_scores:
+                idx = index.get(cs.criterion_id)
+                if idx is not None:
+                    scores[idx] = cs.score
+            self._scores_np = scores
+        return self._scores_np
+
+    def invalidate_score_lookup(self) -> None:
+        """Drop the cached score views after criterion_scores change."""
+        self._score_lookup = None
+        self._scores_np = None
+
     def calculate_scores(self, standards_service) -> None:
         """
         Calculate part scores and overall maturity score from criterion scores.
@@ -84,63 +165,108 @@ class Assessment(BaseModel):
         Formula: Overall = (Part_I × 0.20) + (Part_II × 0.35) + (Part_III × 0.30) + (Part_IV × 0.15)
         """
         from app.services.standards_service import standards_service as std_svc
-        
-        # Build lookup of criterion scores
-        score_lookup = {cs.criterion_id: cs.score for cs in self.criterion_scores}
-        
-        # Calculate scores per part
-        parts = std_svc.get_parts()
-        part_weights = {"I": 0.20, "II": 0.35, "III": 0.30, "IV": 0.15}
-        
-        total_weighted = 0.0
-        total_weight = 0.0
-        
-        for part in parts:
-            chapter_scores = []
-            for chapter in part.chapters:
-                criteria_in_chapter = []
-                for criterion in chapter.criteria:
-                    if criterion.id in score_lookup:
-                        criteria_in_chapter.append(score_lookup[criterion.id])
-                
-                if criteria_in_chapter:
-                    chapter_avg = sum(criteria_in_chapter) / len(criteria_in_chapter)
-                    chapter_scores.append(chapter_avg * chapter.weight)
-            
-            if chapter_scores:
-                part_score = sum(chapter_scores)
-                self.part_scores[part.number] = round(part_score, 2)
-                
-                weight = part_weights.get(part.number, 0.25)
-                total_weighted += part_score * weight
-                total_weight += weight
+
+        # Reduce the dense criterion vector to chapter and part scores
+        # with bincounts over the precomputed reduction index instead of
+        # walking the parts/chapters/criteria tree in Python.
+        index = std_svc.get_score_index()
+        scores = self.get_scores_array()
+        present = ~np.isnan(scores)
+
+        chap_idx = index.chapter_of_criterion[present]
+        sums = np.bincount(chap_idx, weights=scores[present], minlength=index.n_chapters)
+        counts = np.bincount(chap_idx, minlength=index.n_chapters)
+        has_scores = counts > 0
+
+        chapter_avg, weighted = _get_scratch(index)
+        chapter_avg.fill(0.0)
+        np.divide(sums, counts, out=chapter_avg, where=has_scores)
+        np.multiply(chapter_avg, index.chapter_weights, out=weighted)
+
+        part_totals = np.bincount(
+            index.part_of_chapter[has_scores],
+            weights=weighted[has_scores],
+            minlength=index.n_parts,
+        )
+        part_assessed = np.bincount(
+            index.part_of_chapter[has_scores], minlength=index.n_parts
+        ) > 0
+
+        for i in np.nonzero(part_assessed)[0]:
+            self.part_scores[index.part_numbers[i]] = _r2(float(part_totals[i]))
+
+        assessed_weights = index.part_weights[part_assessed]
+        total_weighted = float((part_totals[part_assessed] * assessed_weights).sum())
+        total_weight = float(assessed_weights.sum())
         
         # Calculate overall score
         if total_weight > 0:
-            self.overall_maturity_score = round(total_weighted / total_weight, 2)
-            
+            self.overall_maturity_score = _r2(total_weighted / total_weight)
+
             # Determine accreditation level
-            score = self.overall_maturity_score
-            if score >= 4.0:
-                self.accreditation_level = AccreditationLevel.EXCELLENT
-            elif score >= 3.5:
-                self.accreditation_level = AccreditationLevel.VERY_GOOD
-            elif score >= 3.0:
-                self.accreditation_level = AccreditationLevel.GOOD
-            elif score >= 2.5:
-                self.accreditation_level = AccreditationLevel.PASS
-            else:
-                self.accreditation_level = AccreditationLevel.NOT_ACCREDITED
+            self.accreditation_level = _LEVELS[
+                np.searchsorted(_THRESHOLDS, self.overall_maturity_score, side="right")
+            ]
         
         # Calculate data completeness
-        total_criteria = len(std_svc.get_all_criteria())
+        total_criteria = index.n_criteria
         assessed_criteria = len(self.criterion_scores)
         self.data_completeness = round(assessed_criteria / total_criteria * 100, 1) if total_criteria > 0 else 0
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat()
-        }
+
+    @classmethod
+    def calculate_scores_batch(cls, assessments: List["Assessment"]) -> None:
+        """
+        Calculate scores for a whole batch of assessments at once.
+
+        Stacks every assessment's dense score vector into one matrix and
+        folds criteria into chapters and chapters into parts with two
+        matrix multiplies against the precomputed membership matrices,
+        so N assessments cost two GEMMs instead of N tree reductions.
+        """
+        if not assessments:
+            return
+        from app.services.standards_service import standards_service as std_svc
+
+        index = std_svc.get_score_index()
+        stacked = np.stack([a.get_scores_array() for a in assessments])
+        mask = ~np.isnan(stacked)
+        filled = np.where(mask, stacked, 0.0)
+
+        sums = filled @ index.chapter_member  # (N, n_chapters)
+        counts = mask.astype(np.float32) @ index.chapter_member
+        has_scores = counts > 0
+        chapter_avg = np.divide(sums, counts, out=np.zeros_like(sums), where=has_scores)
+
+        # Chapters without scores contribute zero weighted score, and the
+        # per-part weight denominator only counts parts that have at
+        # least one assessed chapter — same exclusions as the scalar path.
+        part_totals = (chapter_avg * index.chapter_weights) @ index.part_member
+        part_assessed = (has_scores.astype(np.float32) @ index.part_member) > 0
+
+        weights = index.part_weights * part_assessed
+        weight_sums = weights.sum(axis=1)
+        overall = np.divide(
+            (part_totals * weights).sum(axis=1),
+            weight_sums,
+            out=np.zeros(len(assessments)),
+            where=weight_sums > 0,
+        )
+
+        # Classify the whole batch against the level thresholds at once
+        overall_rounded = np.round(overall, 2)
+        level_idx = np.searchsorted(_THRESHOLDS, overall_rounded, side="right")
+
+        for row, assessment in enumerate(assessments):
+            for col in np.nonzero(part_assessed[row])[0]:
+                assessment.part_scores[index.part_numbers[col]] = _r2(
+                    float(part_totals[row, col])
+                )
+            if weight_sums[row] > 0:
+                assessment.overall_maturity_score = float(overall_rounded[row])
+                assessment.accreditation_level = _LEVELS[level_idx[row]]
+            if index.n_criteria > 0:
+                assessment.data_completeness = round(
+                    len(assessment.criterion_scores) / index.n_criteria * 100, 1
+                )
 
 
@@ -2,59 +2,155 @@
 Assessment Service - CRUD operations for assessments.
 Uses JSON file storage for development mode.
 """
-import json
 import random
+import threading
+from bisect import bisect_right, insort
+from collections import defaultdict
+from operator import attrgetter
 from datetime import datetime, date
 from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 from app.models.assessment import (
     Assessment, CriterionScore, AccreditationLevel,
-    ChapterScore, PartScore
+    ChapterScore, PartScore, _r2
 )
 from app.services.standards_service import standards_service
 from app.core.config import settings
 
+# Part weights from the HA framework; overall = sum(part_score * weight)
+_PART_WEIGHTS = {"I": 0.20, "II": 0.35, "III": 0.30, "IV": 0.15}
+_DEFAULT_PART_WEIGHT = 0.25
+
+# Level boundaries in ascending order; bisect_right maps a score to its
+# slot in _LEVEL_ORDER with the same >= boundary semantics as the old
+# comparison ladder
+# Sort key for the per-hospital buckets
+_BY_DATE = attrgetter("assessment_date")
+
+_LEVEL_THRESHOLDS = (2.5, 3.0, 3.5, 4.0)
+_LEVEL_ORDER = (
+    AccreditationLevel.NOT_ACCREDITED,
+    AccreditationLevel.PASS,
+    AccreditationLevel.GOOD,
+    AccreditationLevel.VERY_GOOD,
+    AccreditationLevel.EXCELLENT,
+)
+
 
 class AssessmentService:
     """Service for managing assessment data."""
-    
+
     def __init__(self):
+        # Mutations run in threadpool workers while reads stay on the
+        # event loop; the lock serializes writers (including shard
+        # persistence) so the in-memory maps never change mid-write
+        self._write_lock = threading.Lock()
         self._data_dir = Path(settings.data_dir)
         self._assessments_file = self._data_dir / "assessments.json"
+        # Per-hospital shard files; writes only rewrite the shards of
+        # the hospitals that actually changed
+        self._shards_dir = self._data_dir / "assessments"
         self._ensure_data_dir()
+        # The standards tree is immutable for the process lifetime, so
+        # resolve the views scoring needs once instead of per assessment
+        self._parts = standards_service.get_parts()
+        self._total_criteria = len(standards_service.get_all_criteria())
+        # Flat criterion_id -> (part number, chapter id, chapter weight)
+        # index so scoring is one pass over the submitted scores instead
+        # of a walk over the whole parts/chapters/criteria tree
+        self._criterion_index: Dict[str, Tuple[str, str, float]] = {
+            criterion.id: (part.number, chapter.id, chapter.weight)
+            for part in self._parts
+            for chapter in part.chapters
+            for criterion in chapter.criteria
+        }
+        self._chapter_index: Dict[str, Tuple[str, float]] = {
+            chapter.id: (part.number, chapter.weight)
+            for part in self._parts
+            for chapter in part.chapters
+        }
+        # Chapter id per ScoreIndex chapter row (the index's membership
+        # matrices are column-ordered by get_all_chapters)
+        self._chapter_ids_by_row: Tuple[str, ...] = tuple(
+            c.id for c in standards_service.get_all_chapters()
+        )
         self._assessments: Dict[str, Assessment] = {}
         self._load_assessments()
+        # Secondary hospital_id -> assessments index so per-hospital
+        # reads don't scan the whole store. Buckets stay sorted by
+        # assessment date, so reads never re-sort.
+        self._by_hospital: Dict[str, List[Assessment]] = defaultdict(list)
+        for a in self._assessments.values():
+            self._by_hospital[a.hospital_id].append(a)
+        for bucket in self._by_hospital.values():
+            bucket.sort(key=_BY_DATE)
     
     def _ensure_data_dir(self):
         """Ensure data directory exists."""
         self._data_dir.mkdir(parents=True, exist_ok=True)
     
     def _load_assessments(self):
-        """Load assessments from JSON file."""
-        if self._assessments_file.exists():
+        """Load assessments from the shard files (or the legacy file)."""
+        if self._shards_dir.is_dir():
+            files = sorted(self._shards_dir.glob("*.json"))
+        else:
+            files = []
+        legacy = not files and self._assessments_file.exists()
+        if legacy:
+            files = [self._assessments_file]
+
+        for path in files:
             try:
-                with open(self._assessments_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for a_data in data:
-                        # Convert date strings back to date objects
-                        if 'assessment_date' in a_data and isinstance(a_data['assessment_date'], str):
-                            a_data['assessment_date'] = date.fromisoformat(a_data['assessment_date'])
-                        assessment = Assessment(**a_data)
-                        self._assessments[assessment.id] = assessment
+                with open(path, 'rb') as f:
+                    data = orjson.loads(f.read())
+                for a_data in data:
+                    # Pydantic parses the ISO date strings itself
+                    assessment = Assessment(**a_data)
+                    self._assessments[assessment.id] = assessment
             except Exception as e:
-                print(f"Error loading assessments: {e}")
-                self._assessments = {}
-        
+                print(f"Error loading assessments from {path.name}: {e}")
+
+        # One-time migration of the legacy single file to shards
+        if legacy and self._assessments:
+            self._save_assessments()
+
         # Initialize with sample data if empty
         if not self._assessments:
             self._init_sample_data()
-    
-    def _save_assessments(self):
-        """Save assessments to JSON file."""
-        data = [a.model_dump() for a in self._assessments.values()]
-        with open(self._assessments_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+
+    def _save_assessments(self, hospital_ids=None):
+        """
+        Save assessments to per-hospital shard files.
+
+        Pass hospital_ids to rewrite only the shards touched by a write;
+        the default rewrites every shard (initial seed / migration).
+        Shards keep a single create from rewriting every hospital's
+        history the way the old single-file store did.
+
+        Callers must hold the write lock (loading in __init__ is still
+        single-threaded, so the seed/migration path is exempt).
+        """
+        self._shards_dir.mkdir(parents=True, exist_ok=True)
+        by_hospital: Dict[str, List[Assessment]] = defaultdict(list)
+        for a in self._assessments.values():
+            by_hospital[a.hospital_id].append(a)
+
+        targets = set(by_hospital) if hospital_ids is None else set(hospital_ids)
+        for hid in targets:
+            shard = self._shards_dir / f"{hid}.json"
+            rows = by_hospital.get(hid)
+            if not rows:
+                shard.unlink(missing_ok=True)
+                continue
+            data = [a.model_dump() for a in rows]
+            # orjson writes dates/datetimes natively; shards are
+            # machine-read, so skip the pretty-printing
+            with open(shard, 'wb') as f:
+                f.write(orjson.dumps(data, default=str))
     
     def _generate_sample_scores(self, base_score: float, variation: float = 0.5) -> List[CriterionScore]:
         """Generate sample criterion scores for demo data."""
@@ -153,65 +249,156 @@ class AssessmentService:
         ]
         
         all_assessments = assessments_h1 + assessments_h2 + assessments_h3
-        
+
+        self._recalculate_batch(all_assessments)
         for assessment in all_assessments:
-            # Calculate scores
-            self._calculate_assessment_scores(assessment)
             self._assessments[assessment.id] = assessment
-        
+
         self._save_assessments()
     
+    def _chapter_averages(self, assessment: Assessment) -> Dict[str, float]:
+        """
+        Average the assessment's scores per chapter in one pass.
+
+        Uses the precomputed criterion index, so cost scales with the
+        scores submitted rather than the size of the framework.
+        """
+        chapter_sums: Dict[str, float] = defaultdict(float)
+        chapter_counts: Dict[str, int] = defaultdict(int)
+        for criterion_id, score in assessment.get_score_lookup().items():
+            info = self._criterion_index.get(criterion_id)
+            if info is None:
+                continue
+            chapter_id = info[1]
+            chapter_sums[chapter_id] += score
+            chapter_counts[chapter_id] += 1
+        return {cid: chapter_sums[cid] / chapter_counts[cid] for cid in chapter_sums}
+
+    def _recalculate_batch(self, assessments: List[Assessment]) -> None:
+        """
+        Recalculate scores for many assessments at once.
+
+        Vectorized form of _calculate_assessment_scores: the same
+        chapter averages, chapter-weight-normalized part scores and
+        part-weighted overall, folded for the whole batch with matrix
+        multiplies against the standards reduction index. Math runs in
+        float64 so the numbers match the scalar path regardless of
+        which entry point scored an assessment.
+        """
+        if not assessments:
+            return
+        for assessment in assessments:
+            assessment.invalidate_score_lookup()
+
+        index = standards_service.get_score_index()
+        # get_scores_array is float64, so the whole pipeline keeps the
+        # scalar path's precision; no upcast of already-degraded values
+        stacked = np.stack([a.get_scores_array() for a in assessments])
+        mask = ~np.isnan(stacked)
+        filled = np.where(mask, stacked, 0.0)
+
+        sums = filled @ index.chapter_member  # (N, n_chapters)
+        counts = mask.astype(np.float64) @ index.chapter_member
+        has_scores = counts > 0
+        chapter_avg = np.divide(sums, counts, out=np.zeros_like(sums), where=has_scores)
+
+        # Part score is the chapter-weighted average over assessed
+        # chapters, normalized by their weight total exactly as the
+        # scalar path does
+        chapter_weights = index.chapter_weights.astype(np.float64)
+        part_totals = (chapter_avg * chapter_weights) @ index.part_member
+        part_weight_totals = (has_scores * chapter_weights) @ index.part_member
+        part_assessed = part_weight_totals > 0
+        part_scores = np.divide(
+            part_totals, part_weight_totals,
+            out=np.zeros_like(part_totals), where=part_assessed,
+        )
+
+        # Overall is the plain part-weighted sum, not normalized by the
+        # assessed part weights — again matching the scalar path
+        part_weights = np.array(
+            [_PART_WEIGHTS.get(p, _DEFAULT_PART_WEIGHT) for p in index.part_numbers]
+        )
+        overall = (part_scores * part_weights).sum(axis=1)
+
+        for row, assessment in enumerate(assessments):
+            # Same reset as the scalar path: stale averages must not
+            # survive a rescore that dropped their chapter or part
+            assessment.chapter_scores = {}
+            assessment.part_scores = {}
+            for col in np.nonzero(has_scores[row])[0]:
+                assessment.chapter_scores[self._chapter_ids_by_row[col]] = _r2(
+                    float(chapter_avg[row, col])
+                )
+            for col in np.nonzero(part_assessed[row])[0]:
+                assessment.part_scores[index.part_numbers[col]] = _r2(
+                    float(part_scores[row, col])
+                )
+            score = _r2(float(overall[row]))
+            assessment.overall_maturity_score = score
+            assessment.accreditation_level = _LEVEL_ORDER[
+                bisect_right(_LEVEL_THRESHOLDS, score)
+            ]
+            assessed_criteria = len(assessment.criterion_scores)
+            assessment.data_completeness = (
+                round(assessed_criteria / self._total_criteria * 100, 1)
+                if self._total_criteria > 0 else 0
+            )
+
     def _calculate_assessment_scores(self, assessment: Assessment) -> None:
         """Calculate part scores and overall maturity score."""
-        # Build lookup of criterion scores
-        score_lookup = {cs.criterion_id: cs.score for cs in assessment.criterion_scores}
-        
-        parts = standards_service.get_parts()
-        part_weights = {"I": 0.20, "II": 0.35, "III": 0.30, "IV": 0.15}
-        
+        # Build lookup of criterion scores (invalidate first: updates may
+        # have replaced criterion_scores since the map was cached)
+        assessment.invalidate_score_lookup()
+
+        # Start from empty maps so chapters or parts whose scores were
+        # removed don't keep their previous averages
+        assessment.chapter_scores = {}
+        assessment.part_scores = {}
+
+        part_totals: Dict[str, float] = defaultdict(float)
+        part_weight_totals: Dict[str, float] = defaultdict(float)
+        for chapter_id, chapter_avg in self._chapter_averages(assessment).items():
+            assessment.chapter_scores[chapter_id] = _r2(chapter_avg)
+            part_number, weight = self._chapter_index[chapter_id]
+            part_totals[part_number] += chapter_avg * weight
+            part_weight_totals[part_number] += weight
+
         total_weighted = 0.0
-        
-        for part in parts:
-            chapter_total = 0.0
-            chapter_weight_total = 0.0
-            
-            for chapter in part.chapters:
-                criteria_scores = []
-                for criterion in chapter.criteria:
-                    if criterion.id in score_lookup:
-                        criteria_scores.append(score_lookup[criterion.id])
-                
-                if criteria_scores:
-                    chapter_avg = sum(criteria_scores) / len(criteria_scores)
-                    chapter_total += chapter_avg * chapter.weight
-                    chapter_weight_total += chapter.weight
-            
-            if chapter_weight_total > 0:
-                part_score = chapter_total / chapter_weight_total
-                assessment.part_scores[part.number] = round(part_score, 2)
-                total_weighted += part_score * part_weights.get(part.number, 0.25)
-        
+        for part_number, weight_total in part_weight_totals.items():
+            part_score = part_totals[part_number] / weight_total
+            assessment.part_scores[part_number] = _r2(part_score)
+            total_weighted += part_score * _PART_WEIGHTS.get(part_number, _DEFAULT_PART_WEIGHT)
+
         # Calculate overall score
-        assessment.overall_maturity_score = round(total_weighted, 2)
+        assessment.overall_maturity_score = _r2(total_weighted)
         
         # Determine accreditation level
-        score = assessment.overall_maturity_score
-        if score >= 4.0:
-            assessment.accreditation_level = AccreditationLevel.EXCELLENT
-        elif score >= 3.5:
-            assessment.accreditation_level = AccreditationLevel.VERY_GOOD
-        elif score >= 3.0:
-            assessment.accreditation_level = AccreditationLevel.GOOD
-        elif score >= 2.5:
-            assessment.accreditation_level = AccreditationLevel.PASS
-        else:
-            assessment.accreditation_level = AccreditationLevel.NOT_ACCREDITED
-        
+        assessment.accreditation_level = _LEVEL_ORDER[
+            bisect_right(_LEVEL_THRESHOLDS, assessment.overall_maturity_score)
+        ]
+
         # Calculate data completeness
-        total_criteria = len(standards_service.get_all_criteria())
         assessed_criteria = len(assessment.criterion_scores)
-        assessment.data_completeness = round(assessed_criteria / total_criteria * 100, 1) if total_criteria > 0 else 0
+        assessment.data_completeness = round(assessed_criteria / self._total_criteria * 100, 1) if self._total_criteria > 0 else 0
     
+    def _index_add(self, assessment: Assessment) -> None:
+        """Put an assessment in the store, keeping the hospital index in sync."""
+        previous = self._assessments.get(assessment.id)
+        if previous is not None:
+            self._by_hospital[previous.hospital_id].remove(previous)
+        self._assessments[assessment.id] = assessment
+        insort(self._by_hospital[assessment.hospital_id], assessment, key=_BY_DATE)
+
+    def _index_remove(self, assessment: Assessment) -> None:
+        """Drop an assessment from the store and the hospital index."""
+        del self._assessments[assessment.id]
+        bucket = self._by_hospital.get(assessment.hospital_id)
+        if bucket is not None:
+            bucket.remove(assessment)
+            if not bucket:
+                del self._by_hospital[assessment.hospital_id]
+
     def get_all(self) -> List[Assessment]:
         """Get all assessments."""
         return list(self._assessments.values())
@@ -219,68 +406,169 @@ class AssessmentService:
     def get_by_id(self, assessment_id: str) -> Optional[Assessment]:
         """Get assessment by ID."""
         return self._assessments.get(assessment_id)
+
+    def get_scoped(self, assessment_id: str, hospital_id: str) -> Optional[Assessment]:
+        """Get an assessment by ID, scoped to a hospital."""
+        assessment = self._assessments.get(assessment_id)
+        if assessment is None or assessment.hospital_id != hospital_id:
+            return None
+        return assessment
+
+    def get_by_ids(self, assessment_ids: List[str]) -> Dict[str, Assessment]:
+        """Get several assessments in one batched lookup, keyed by ID."""
+        found = {}
+        for aid in assessment_ids:
+            assessment = self._assessments.get(aid)
+            if assessment is not None:
+                found[aid] = assessment
+        return found
     
     def get_by_hospital(self, hospital_id: str) -> List[Assessment]:
         """Get all assessments for a hospital, sorted by date."""
-        assessments = [a for a in self._assessments.values() if a.hospital_id == hospital_id]
-        return sorted(assessments, key=lambda a: a.assessment_date)
+        return list(self._by_hospital.get(hospital_id, ()))
+
+    def fetch_for_hospital(self, hospital_id: str) -> Optional[List[Assessment]]:
+        """
+        Verify the hospital exists and fetch its assessments in one call.
+
+        Returns None if the hospital does not exist, otherwise the
+        hospital's assessments sorted by date (possibly empty).
+        """
+        from app.services.hospital_service import hospital_service
+
+        if hospital_service.get_by_id(hospital_id) is None:
+            return None
+        return self.get_by_hospital(hospital_id)
     
+    def get_summary_stats_by_hospital(
+        self, hospital_ids: Optional[List[str]] = None
+    ) -> Dict[str, Tuple[Assessment, int]]:
+        """
+        Get (latest assessment, assessment count) per hospital in one
+        pass over the store.
+
+        Listing endpoints only need the latest record and the count per
+        hospital; this avoids re-scanning and re-sorting the full store
+        once per hospital. Pass hospital_ids to restrict the aggregation
+        to a filtered hospital list.
+        """
+        wanted = set(hospital_ids) if hospital_ids is not None else None
+        latest: Dict[str, Assessment] = {}
+        counts: Dict[str, int] = {}
+        # Snapshot: threadpool writers may insert while we aggregate
+        for a in list(self._assessments.values()):
+            if wanted is not None and a.hospital_id not in wanted:
+                continue
+            counts[a.hospital_id] = counts.get(a.hospital_id, 0) + 1
+            current = latest.get(a.hospital_id)
+            if current is None or a.assessment_date > current.assessment_date:
+                latest[a.hospital_id] = a
+        return {hid: (latest[hid], counts[hid]) for hid in counts}
+
+    def latest_updated_at(self, hospital_id: str) -> Optional[datetime]:
+        """
+        Get the newest updated_at across a hospital's assessments.
+
+        Cheap single-pass probe used as a cache version: any write for
+        the hospital changes this value.
+        """
+        rows = list(self._by_hospital.get(hospital_id, ()))
+        return max(a.updated_at for a in rows) if rows else None
+
     def get_latest_by_hospital(self, hospital_id: str) -> Optional[Assessment]:
         """Get the latest assessment for a hospital."""
-        assessments = self.get_by_hospital(hospital_id)
-        return assessments[-1] if assessments else None
+        bucket = self._by_hospital.get(hospital_id)
+        return bucket[-1] if bucket else None
     
     def create(self, assessment: Assessment) -> Assessment:
         """Create a new assessment."""
         assessment.created_at = datetime.utcnow()
         assessment.updated_at = datetime.utcnow()
         self._calculate_assessment_scores(assessment)
-        self._assessments[assessment.id] = assessment
-        self._save_assessments()
+        with self._write_lock:
+            self._index_add(assessment)
+            self._save_assessments([assessment.hospital_id])
         return assessment
     
+    def bulk_create(self, assessments: List[Assessment]) -> int:
+        """
+        Create several assessments with a single persistence write.
+
+        Import paths call this instead of create() in a loop so the JSON
+        store is rewritten once per batch instead of once per row.
+        """
+        now = datetime.utcnow()
+        self._recalculate_batch(assessments)
+        with self._write_lock:
+            for assessment in assessments:
+                assessment.created_at = now
+                assessment.updated_at = now
+                self._index_add(assessment)
+            if assessments:
+                self._save_assessments({a.hospital_id for a in assessments})
+        return len(assessments)
+
     def update(self, assessment_id: str, updates: dict) -> Optional[Assessment]:
         """Update an assessment."""
-        assessment = self._assessments.get(assessment_id)
-        if not assessment:
-            return None
-        
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(assessment, key) and key not in ['id', 'created_at']:
-                setattr(assessment, key, value)
-        
-        assessment.updated_at = datetime.utcnow()
-        
-        # Recalculate scores if criterion_scores changed
-        if 'criterion_scores' in updates:
-            self._calculate_assessment_scores(assessment)
-        
-        self._assessments[assessment_id] = assessment
-        self._save_assessments()
-        return assessment
+        with self._write_lock:
+            assessment = self._assessments.get(assessment_id)
+            if not assessment:
+                return None
+
+            old_hospital_id = assessment.hospital_id
+
+            # Update fields
+            for key, value in updates.items():
+                if hasattr(assessment, key) and key not in ['id', 'created_at']:
+                    setattr(assessment, key, value)
+
+            assessment.updated_at = datetime.utcnow()
+
+            # Recalculate scores if criterion_scores changed
+            if 'criterion_scores' in updates:
+                self._calculate_assessment_scores(assessment)
+
+            if assessment.hospital_id != old_hospital_id:
+                # Reassignment between hospitals: move the index entry and
+                # rewrite both shards
+                self._by_hospital[old_hospital_id].remove(assessment)
+                insort(self._by_hospital[assessment.hospital_id], assessment, key=_BY_DATE)
+                self._save_assessments([old_hospital_id, assessment.hospital_id])
+            else:
+                if 'assessment_date' in updates:
+                    # Reposition within the bucket when the sort key changed
+                    bucket = self._by_hospital[assessment.hospital_id]
+                    bucket.remove(assessment)
+                    insort(bucket, assessment, key=_BY_DATE)
+                self._save_assessments([assessment.hospital_id])
+            return assessment
     
     def delete(self, assessment_id: str) -> bool:
         """Delete an assessment."""
-        if assessment_id in self._assessments:
-            del self._assessments[assessment_id]
-            self._save_assessments()
-            return True
-        return False
-    
+        with self._write_lock:
+            assessment = self._assessments.get(assessment_id)
+            if assessment is not None:
+                self._index_remove(assessment)
+                self._save_assessments([assessment.hospital_id])
+                return True
+            return False
+
     def delete_by_hospital(self, hospital_id: str) -> int:
         """Delete all assessments for a hospital. Returns count deleted."""
-        to_delete = [a.id for a in self._assessments.values() if a.hospital_id == hospital_id]
-        for aid in to_delete:
-            del self._assessments[aid]
-        if to_delete:
-            self._save_assessments()
-        return len(to_delete)
+        with self._write_lock:
+            bucket = self._by_hospital.pop(hospital_id, [])
+            for assessment in bucket:
+                del self._assessments[assessment.id]
+            if bucket:
+                self._save_assessments([hospital_id])
+            return len(bucket)
     
     def get_trends(self, hospital_id: str) -> Dict:
         """Get score trends across assessments for a hospital."""
-        assessments = self.get_by_hospital(hospital_id)
-        
+        return self.build_trends(self.get_by_hospital(hospital_id))
+
+    def build_trends(self, assessments: List[Assessment]) -> Dict:
+        """Build trend data from an already-fetched assessment list."""
         if not assessments:
             return {"assessments": [], "trends": {}}
         
@@ -336,29 +624,40 @@ class AssessmentService:
         assessment = self._assessments.get(assessment_id)
         if not assessment:
             return []
-        
-        score_lookup = {cs.criterion_id: cs for cs in assessment.criterion_scores}
+
+        # Group the assessment's score rows per chapter in one pass over
+        # what was submitted, instead of probing a lookup for every
+        # criterion in the framework
+        by_chapter: Dict[str, List[CriterionScore]] = defaultdict(list)
+        for cs in assessment.criterion_scores:
+            info = self._criterion_index.get(cs.criterion_id)
+            if info is not None:
+                by_chapter[info[1]].append(cs)
+
+        # Chapter averages were already computed (and rounded) when the
+        # assessment was scored; only fall back to recomputing if a
+        # chapter is somehow missing from the stored map
+        stored = assessment.chapter_scores
         chapter_scores = []
-        
         for chapter in standards_service.get_all_chapters():
-            criteria_scores = []
-            for criterion in chapter.criteria:
-                if criterion.id in score_lookup:
-                    criteria_scores.append(score_lookup[criterion.id])
-            
-            if criteria_scores:
-                avg_score = sum(cs.score for cs in criteria_scores) / len(criteria_scores)
-            else:
-                avg_score = 0.0
-            
+            criteria_scores = by_chapter.get(chapter.id, [])
+            avg_score = stored.get(chapter.id)
+            if avg_score is None:
+                if criteria_scores:
+                    avg_score = round(
+                        sum(cs.score for cs in criteria_scores) / len(criteria_scores), 2
+                    )
+                else:
+                    avg_score = 0.0
+
             chapter_scores.append(ChapterScore(
                 chapter_id=chapter.id,
-                score=round(avg_score, 2),
+                score=avg_score,
                 criteria_scores=criteria_scores,
                 criteria_count=len(chapter.criteria),
                 criteria_assessed=len(criteria_scores),
             ))
-        
+
         return chapter_scores
     
     def compare_assessments(self, assessment_id_1: str, assessment_id_2: str) -> Dict:
@@ -380,8 +679,8 @@ class AssessmentService:
             part_diffs[part] = round(score2 - score1, 2)
         
         # Find improved and regressed criteria
-        score_lookup_1 = {cs.criterion_id: cs.score for cs in a1.criterion_scores}
-        score_lookup_2 = {cs.criterion_id: cs.score for cs in a2.criterion_scores}
+        score_lookup_1 = a1.get_score_lookup()
+        score_lookup_2 = a2.get_score_lookup()
         
         improved = []
         regressed = []
@@ -1,10 +1,14 @@
 """Authentication service for user management."""
-import json
+import hashlib
 import os
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
+import orjson
+
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password, create_access_token
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, Token, UserRole
@@ -13,12 +17,26 @@ from app.schemas.auth import UserCreate, UserLogin, UserResponse, Token, UserRol
 class AuthService:
     """Service for handling user authentication."""
 
+    # Successful bcrypt verifications are remembered briefly so repeat
+    # logins from the same user skip the deliberately slow hash check
+    _VERIFIED_TTL = 300.0
+    _VERIFIED_MAX = 1024
+
     def __init__(self):
         """Initialize the auth service with storage."""
+        # Serializes registrations against each other and the file write
+        self._write_lock = threading.Lock()
         self.data_dir = Path(settings.data_dir)
         self.users_file = self.data_dir / "users.json"
         self._ensure_data_dir()
+        # Users live in memory like the other stores; the file is only
+        # read once here and rewritten on changes
+        self._users: Dict[str, Any] = self._load_users()
         self._init_default_users()
+        self._email_index: Dict[str, Dict[str, Any]] = {
+            u["email"]: u for u in self._users.values()
+        }
+        self._verified: Dict[Tuple[str, str, str], float] = {}
 
     def _ensure_data_dir(self):
         """Ensure the data directory exists."""
@@ -27,18 +45,19 @@ class AuthService:
     def _load_users(self) -> Dict[str, Any]:
         """Load users from JSON file."""
         if self.users_file.exists():
-            with open(self.users_file, "r") as f:
-                return json.load(f)
+            with open(self.users_file, "rb") as f:
+                return orjson.loads(f.read())
         return {}
 
     def _save_users(self, users: Dict[str, Any]):
         """Save users to JSON file."""
-        with open(self.users_file, "w") as f:
-            json.dump(users, f, indent=2)
+        # Keep the indent: users.json is small and hand-editable
+        with open(self.users_file, "wb") as f:
+            f.write(orjson.dumps(users, option=orjson.OPT_INDENT_2))
 
     def _init_default_users(self):
         """Initialize default users if none exist."""
-        users = self._load_users()
+        users = self._users
         if not users:
             # Create default QI Team user
             qi_user_id = str(uuid.uuid4())
@@ -62,30 +81,26 @@ class AuthService:
 
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get a user by their email address."""
-        users = self._load_users()
-        for user_id, user_data in users.items():
-            if user_data["email"] == email:
-                return user_data
-        return None
+        return self._email_index.get(email)
 
     def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create a new user."""
-        users = self._load_users()
-
-        # Check if email already exists
-        if self.get_user_by_email(user_data.email):
-            raise ValueError("Email already registered")
-
-        user_id = str(uuid.uuid4())
-        new_user = {
-            "id": user_id,
-            "email": user_data.email,
-            "password": get_password_hash(user_data.password),
-            "name": user_data.name,
-            "role": user_data.role.value
-        }
-        users[user_id] = new_user
-        self._save_users(users)
+        with self._write_lock:
+            # Check if email already exists
+            if self.get_user_by_email(user_data.email):
+                raise ValueError("Email already registered")
+
+            user_id = str(uuid.uuid4())
+            new_user = {
+                "id": user_id,
+                "email": user_data.email,
+                "password": get_password_hash(user_data.password),
+                "name": user_data.name,
+                "role": user_data.role.value
+            }
+            self._users[user_id] = new_user
+            self._email_index[user_data.email] = new_user
+            self._save_users(self._users)
 
         return UserResponse(
             id=user_id,
@@ -94,12 +109,35 @@ class AuthService:
             role=user_data.role
         )
 
+    def _password_ok(self, user: Dict[str, Any], password: str) -> bool:
+        """
+        Verify a password, caching successful checks for a short TTL.
+
+        The key carries a digest of the attempt plus the stored hash, so
+        a password change invalidates old entries immediately. Failures
+        are never cached: a wrong password always pays full bcrypt cost.
+        """
+        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        key = (user["email"], digest, user["password"])
+        now = time.monotonic()
+        expires = self._verified.get(key)
+        if expires is not None and now < expires:
+            return True
+
+        if not verify_password(password, user["password"]):
+            return False
+
+        if len(self._verified) >= self._VERIFIED_MAX:
+            self._verified.clear()
+        self._verified[key] = now + self._VERIFIED_TTL
+        return True
+
     def authenticate_user(self, login_data: UserLogin) -> Optional[Token]:
         """Authenticate a user and return a token."""
         user = self.get_user_by_email(login_data.email)
         if not user:
             return None
-        if not verify_password(login_data.password, user["password"]):
+        if not self._password_ok(user, login_data.password):
             return None
 
         # Create access token
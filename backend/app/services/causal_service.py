@@ -4,11 +4,16 @@ Provides causal effect estimation, counterfactual analysis, and structure learni
 Uses simplified implementations (can be extended with DoWhy/pgmpy).
 """
 
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 import random
 import math
 
+import orjson
+
+from app.core.cache import ttl_cache
 from app.services.standards_service import get_standards_service
 from app.services.assessment_service import get_assessment_service
 
@@ -22,13 +27,37 @@ class CausalMethod:
     INSTRUMENTAL_VARIABLE = "instrumental_variable"
 
 
+def _count_by_part(nodes: Dict) -> Dict:
+    """Count nodes by part."""
+    return dict(Counter(node.get("part", "Unknown") for node in nodes.values()))
+
+
 class CausalService:
     """Service for causal inference operations."""
-    
+
     def __init__(self):
         self.standards_service = get_standards_service()
         self.assessment_service = get_assessment_service()
         self._causal_graph = self._build_causal_graph()
+        # The graph is static within a process lifetime, so summarize it
+        # once here instead of on every /graph/summary request.
+        self._graph_summary = {
+            "total_nodes": len(self._causal_graph["nodes"]),
+            "total_edges": len(self._causal_graph["edges"]),
+            "nodes_by_part": _count_by_part(self._causal_graph["nodes"]),
+            "edges_sample": self._causal_graph["edges"][:10],
+        }
+        # The methods list is static metadata; serialize it once so the
+        # /methods endpoint is a raw bytes write.
+        self._methods_json = orjson.dumps({"methods": self.get_available_methods()})
+
+    def get_graph_summary(self) -> Dict:
+        """Get the precomputed summary of the causal graph structure."""
+        return self._graph_summary
+
+    def get_methods_json(self) -> bytes:
+        """Get the pre-serialized JSON body for the methods endpoint."""
+        return self._methods_json
     
     def _build_causal_graph(self) -> Dict:
         """Build the causal graph from standards relationships."""
@@ -148,7 +177,7 @@ class CausalService:
             return {"error": "No assessment data available"}
         
         # Find current scores
-        score_map = {cs.criterion_id: cs.score for cs in assessment.criterion_scores}
+        score_map = assessment.get_score_lookup()
         
         # Get approximate current value for intervention criterion
         current_intervention = score_map.get(intervention_criterion, 3.0)
@@ -255,7 +284,7 @@ class CausalService:
         assessment = self.assessment_service.get_latest_by_hospital(hospital_id)
         score_map = {}
         if assessment:
-            score_map = {cs.criterion_id: cs.score for cs in assessment.criterion_scores}
+            score_map = assessment.get_score_lookup()
         
         gap_score = score_map.get(gap_criterion, 2.5)
         
@@ -312,6 +341,7 @@ class CausalService:
             "recommendation": self._generate_root_cause_recommendation(root_causes[:3]),
         }
     
+    @ttl_cache(ttl_seconds=3600)
     def cascade_analysis(
         self,
         intervention_criterion: str,
@@ -407,6 +437,10 @@ class CausalService:
             },
         ]
     
+    # The graph never changes within a process lifetime, so memoize the
+    # DFS permanently rather than with a TTL; each (source, target) pair
+    # is traversed at most once.
+    @lru_cache(maxsize=4096)
     def _find_causal_paths(self, source: str, target: str) -> Dict:
         """Find all causal paths between source and target."""
         paths = []
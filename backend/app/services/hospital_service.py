@@ -4,8 +4,9 @@ Uses JSON file storage for development mode.
 """
 import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
 from app.models.hospital import Hospital, HospitalType, Ownership, Region
@@ -16,6 +17,9 @@ class HospitalService:
     """Service for managing hospital data."""
     
     def __init__(self):
+        # Mutations run in threadpool workers while reads stay on the
+        # event loop; the lock serializes writers and file persistence
+        self._write_lock = threading.Lock()
         self._data_dir = Path(settings.data_dir)
         self._hospitals_file = self._data_dir / "hospitals.json"
         self._ensure_data_dir()
@@ -44,8 +48,12 @@ class HospitalService:
             self._init_sample_data()
     
     def _save_hospitals(self):
-        """Save hospitals to JSON file."""
-        data = [h.model_dump() for h in self._hospitals.values()]
+        """Save hospitals to JSON file.
+
+        Callers must hold the write lock (seeding in __init__ is still
+        single-threaded, so that path is exempt).
+        """
+        data = [h.model_dump() for h in list(self._hospitals.values())]
         with open(self._hospitals_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, default=str, ensure_ascii=False)
     
@@ -122,33 +130,36 @@ class HospitalService:
         """Create a new hospital."""
         hospital.created_at = datetime.utcnow()
         hospital.updated_at = datetime.utcnow()
-        self._hospitals[hospital.id] = hospital
-        self._save_hospitals()
+        with self._write_lock:
+            self._hospitals[hospital.id] = hospital
+            self._save_hospitals()
         return hospital
-    
+
     def update(self, hospital_id: str, updates: dict) -> Optional[Hospital]:
         """Update a hospital."""
-        hospital = self._hospitals.get(hospital_id)
-        if not hospital:
-            return None
-        
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(hospital, key) and key not in ['id', 'created_at']:
-                setattr(hospital, key, value)
-        
-        hospital.updated_at = datetime.utcnow()
-        self._hospitals[hospital_id] = hospital
-        self._save_hospitals()
-        return hospital
-    
+        with self._write_lock:
+            hospital = self._hospitals.get(hospital_id)
+            if not hospital:
+                return None
+
+            # Update fields
+            for key, value in updates.items():
+                if hasattr(hospital, key) and key not in ['id', 'created_at']:
+                    setattr(hospital, key, value)
+
+            hospital.updated_at = datetime.utcnow()
+            self._hospitals[hospital_id] = hospital
+            self._save_hospitals()
+            return hospital
+
     def delete(self, hospital_id: str) -> bool:
         """Delete a hospital."""
-        if hospital_id in self._hospitals:
-            del self._hospitals[hospital_id]
-            self._save_hospitals()
-            return True
-        return False
+        with self._write_lock:
+            if hospital_id in self._hospitals:
+                del self._hospitals[hospital_id]
+                self._save_hospitals()
+                return True
+            return False
     
     def search(
         self,
@@ -183,7 +194,49 @@ class HospitalService:
             results = [h for h in results if h.bed_count <= max_beds]
         
         return results
-    
+
+    def search_with_stats(
+        self,
+        name: Optional[str] = None,
+        hospital_type: Optional[HospitalType] = None,
+        region: Optional[Region] = None,
+        ownership: Optional[Ownership] = None,
+        min_beds: Optional[int] = None,
+        max_beds: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Tuple[Hospital, Optional[object], int]], int]:
+        """
+        Search hospitals and join each with its latest assessment and count.
+
+        One filtered scan here plus one assessment-store scan, so the
+        caller gets (hospital, latest_assessment, assessment_count) rows
+        without issuing per-hospital lookups. Returns the requested page
+        of rows plus the total match count; the assessment aggregation
+        only covers the page.
+        """
+        # Imported here so the two store services stay import-order
+        # independent
+        from app.services.assessment_service import assessment_service
+
+        hospitals = self.search(
+            name=name,
+            hospital_type=hospital_type,
+            region=region,
+            ownership=ownership,
+            min_beds=min_beds,
+            max_beds=max_beds,
+        )
+        total = len(hospitals)
+        if offset:
+            hospitals = hospitals[offset:]
+        if limit is not None:
+            hospitals = hospitals[:limit]
+        stats = assessment_service.get_summary_stats_by_hospital(
+            [h.id for h in hospitals]
+        )
+        return [(h,) + stats.get(h.id, (None, 0)) for h in hospitals], total
+
     def get_statistics(self) -> dict:
         """Get statistics about hospitals."""
         hospitals = list(self._hospitals.values())
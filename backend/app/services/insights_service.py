@@ -4,7 +4,7 @@ Analyzes assessment data to provide actionable insights for quality improvement.
 """
 
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Dict, Optional, List
 import random
 
 from app.services.standards_service import StandardsService, get_standards_service
@@ -35,6 +35,21 @@ class InsightsService:
     def __init__(self):
         self.standards_service = get_standards_service()
         self.assessment_service = get_assessment_service()
+        # Criterion id -> category value, built once so category checks
+        # are dict lookups instead of a chapter fetch plus linear scan
+        self._criterion_category: Dict[str, str] = {
+            criterion.id: criterion.category.value
+            for chapter in self.standards_service.get_all_chapters()
+            for criterion in chapter.criteria
+        }
+        # Criterion id -> owning chapter id; criterion ids use dot
+        # notation ("I-1.1"), so deriving the chapter by splitting the id
+        # is fragile — the standards tree is the source of truth
+        self._criterion_chapter: Dict[str, str] = {
+            criterion.id: chapter.id
+            for chapter in self.standards_service.get_all_chapters()
+            for criterion in chapter.criteria
+        }
     
     def generate_insights(self, hospital_id: str) -> dict:
         """Generate comprehensive insights for a hospital."""
@@ -52,9 +67,14 @@ class InsightsService:
         
         latest = assessments[-1]
         insights = []
-        
+
+        # Group the latest assessment's scores by chapter once; the gap
+        # and root-cause sections below both need the grouping and used
+        # to rebuild it with a full rescan per chapter
+        scores_by_chapter = self._group_scores_by_chapter(latest)
+
         # Generate gap analysis insights
-        gap_insights = self._generate_gap_insights(latest)
+        gap_insights = self._generate_gap_insights(latest, scores_by_chapter)
         insights.extend(gap_insights)
         
         # Generate trend insights
@@ -67,7 +87,7 @@ class InsightsService:
         insights.extend(risk_insights)
         
         # Generate root cause insights
-        root_cause_insights = self._generate_root_cause_insights(latest)
+        root_cause_insights = self._generate_root_cause_insights(scores_by_chapter)
         insights.extend(root_cause_insights)
         
         # Generate benchmark insights
@@ -95,7 +115,16 @@ class InsightsService:
             "risk_level": self._get_risk_level(risk_score),
         }
     
-    def _generate_gap_insights(self, assessment) -> list:
+    def _group_scores_by_chapter(self, assessment) -> Dict[str, list]:
+        """Group an assessment's criterion scores by chapter id in one pass."""
+        grouped: Dict[str, list] = {}
+        for cs in assessment.criterion_scores:
+            chapter_id = self._criterion_chapter.get(cs.criterion_id)
+            if chapter_id is not None:
+                grouped.setdefault(chapter_id, []).append(cs)
+        return grouped
+
+    def _generate_gap_insights(self, assessment, scores_by_chapter: Dict[str, list]) -> list:
         """Generate insights about compliance gaps."""
         insights = []
         
@@ -152,10 +181,7 @@ class InsightsService:
         # Domain-specific gaps
         chapters = self.standards_service.get_all_chapters()
         for chapter in chapters:
-            chapter_scores = [
-                cs for cs in assessment.criterion_scores
-                if cs.criterion_id.startswith(chapter.id)
-            ]
+            chapter_scores = scores_by_chapter.get(chapter.id, [])
             if chapter_scores:
                 avg_score = sum(cs.score for cs in chapter_scores) / len(chapter_scores)
                 if avg_score < 2.5:
@@ -309,23 +335,18 @@ class InsightsService:
         
         return insights
     
-    def _generate_root_cause_insights(self, assessment) -> list:
+    def _generate_root_cause_insights(self, scores_by_chapter: Dict[str, list]) -> list:
         """Generate root cause analysis insights using causal relationships."""
         insights = []
-        
+
         relationships = self.standards_service.get_causal_relationships()
-        
+
         # Find chapters with low scores that might be root causes
-        chapter_scores = {}
-        chapters = self.standards_service.get_all_chapters()
-        
-        for chapter in chapters:
-            chapter_criteria = [
-                cs for cs in assessment.criterion_scores
-                if cs.criterion_id.startswith(chapter.id)
-            ]
-            if chapter_criteria:
-                chapter_scores[chapter.id] = sum(cs.score for cs in chapter_criteria) / len(chapter_criteria)
+        chapter_scores = {
+            chapter_id: sum(cs.score for cs in chapter_criteria) / len(chapter_criteria)
+            for chapter_id, chapter_criteria in scores_by_chapter.items()
+            if chapter_criteria
+        }
         
         # Identify potential root causes (low-scoring chapters that influence many others)
         influence_count = {}
@@ -509,16 +530,7 @@ class InsightsService:
     
     def _get_criterion_category(self, criterion_id: str) -> str:
         """Get the category of a criterion."""
-        # Parse criterion ID to get chapter
-        parts = criterion_id.split("-")
-        if len(parts) >= 2:
-            chapter_id = f"{parts[0]}-{parts[1]}"
-            chapter = self.standards_service.get_chapter(chapter_id)
-            if chapter:
-                for criterion in chapter.criteria:
-                    if criterion.id == criterion_id:
-                        return criterion.category.value
-        return "basic"
+        return self._criterion_category.get(criterion_id, "basic")
     
     def _estimate_impact(self, insight: dict) -> str:
         """Estimate impact level of addressing an insight."""
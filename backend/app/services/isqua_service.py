@@ -6,6 +6,8 @@ Maps ISQua 9 Principles to HA Thailand Standards.
 from typing import Optional, List, Dict
 from enum import Enum
 
+import numpy as np
+
 
 class ISQuaRating(int, Enum):
     """ISQua 3-point rating scale."""
@@ -14,6 +16,11 @@ class ISQuaRating(int, Enum):
     FULLY_MET = 3
 
 
+# HA score bands for ISQua ratings: <2.0 not met, [2.0, 4.0) partially
+# met, >=4.0 fully met.
+_ISQUA_BINS = np.array([2.0, 4.0])
+
+
 class ISQuaService:
     """Service for ISQua EEA framework integration."""
     
@@ -321,6 +328,13 @@ class ISQuaService:
             return ISQuaRating.PARTIALLY_MET.value
         return ISQuaRating.NOT_MET.value
     
+    def convert_batch(self, ha_scores: List[float]) -> List[int]:
+        """Convert many HA scores to ISQua ratings in one vectorized pass."""
+        if not ha_scores:
+            return []
+        ratings = np.digitize(np.asarray(ha_scores, dtype=np.float64), _ISQUA_BINS) + 1
+        return [int(r) for r in ratings]
+
     def convert_isqua_to_ha_score(self, isqua_rating: int) -> float:
         """Convert ISQua rating (1-3) to HA Thailand score range."""
         mapping = {
@@ -340,18 +354,24 @@ class ISQuaService:
         if not principle:
             return {"error": "Principle not found"}
         
-        # Get scores for mapped chapters
+        # Get scores for mapped chapters; ratings are converted for the
+        # whole set in one vectorized pass
+        chapter_ids = [
+            cid for cid in principle["ha_chapters"] if cid in ha_chapter_scores
+        ]
+        ha_scores = [ha_chapter_scores[cid] for cid in chapter_ids]
+        ratings = self.convert_batch(ha_scores)
+
         chapter_scores = []
-        for chapter_id in principle["ha_chapters"]:
-            if chapter_id in ha_chapter_scores:
-                mapping = self._ha_mapping.get(chapter_id, {})
-                chapter_scores.append({
-                    "chapter_id": chapter_id,
-                    "chapter_name": mapping.get("chapter_name", chapter_id),
-                    "ha_score": ha_chapter_scores[chapter_id],
-                    "isqua_rating": self.convert_ha_score_to_isqua(ha_chapter_scores[chapter_id]),
-                    "alignment_strength": mapping.get("alignment_strength", 0.8),
-                })
+        for chapter_id, ha_score, rating in zip(chapter_ids, ha_scores, ratings):
+            mapping = self._ha_mapping.get(chapter_id, {})
+            chapter_scores.append({
+                "chapter_id": chapter_id,
+                "chapter_name": mapping.get("chapter_name", chapter_id),
+                "ha_score": ha_score,
+                "isqua_rating": rating,
+                "alignment_strength": mapping.get("alignment_strength", 0.8),
+            })
         
         # Calculate principle score
         if chapter_scores:
@@ -364,13 +384,14 @@ class ISQuaService:
         else:
             principle_score = 0
         
+        principle_rating = self.convert_ha_score_to_isqua(principle_score)
         return {
             "principle_id": principle_id,
             "principle_name": principle["name"],
             "principle_number": principle["number"],
             "ha_score": round(principle_score, 2),
-            "isqua_rating": self.convert_ha_score_to_isqua(principle_score),
-            "isqua_rating_text": self._get_rating_text(self.convert_ha_score_to_isqua(principle_score)),
+            "isqua_rating": principle_rating,
+            "isqua_rating_text": self._get_rating_text(principle_rating),
             "chapter_details": chapter_scores,
             "focus_areas": principle["focus_areas"],
         }
@@ -399,10 +420,11 @@ class ISQuaService:
         for pr in principle_results:
             rating_summary[pr["isqua_rating"]] = rating_summary.get(pr["isqua_rating"], 0) + 1
         
+        overall_rating = self.convert_ha_score_to_isqua(overall_score)
         return {
             "overall_ha_score": round(overall_score, 2),
-            "overall_isqua_rating": self.convert_ha_score_to_isqua(overall_score),
-            "overall_isqua_text": self._get_rating_text(self.convert_ha_score_to_isqua(overall_score)),
+            "overall_isqua_rating": overall_rating,
+            "overall_isqua_text": self._get_rating_text(overall_rating),
             "principle_results": principle_results,
             "rating_summary": {
                 "not_met": rating_summary[1],
@@ -4,6 +4,7 @@ Calculates the impact of improvement interventions on accreditation scores.
 """
 import json
 import math
+import time
 import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
@@ -84,9 +85,28 @@ class Scenario(BaseModel):
 class SimulationService:
     """Service for what-if simulations and maturity projections."""
     
+    # Stages a hospital can be in, used to pre-bucket scenarios
+    _STAGES = ("below_good", "good_to_very_good", "very_good_to_excellent")
+
+    # Short memo for identical simulation runs; entries are keyed on the
+    # hospital's assessment version so writes naturally invalidate them
+    _RESULT_CACHE_TTL = 300.0
+    _RESULT_CACHE_MAX = 256
+
     def __init__(self):
+        self._result_cache: Dict[tuple, Tuple[float, SimulationResult]] = {}
         self._scenarios = self._build_scenarios()
         self._causal_strengths = self._build_causal_lookup()
+        # The catalog is static, so id lookup and per-stage filtering
+        # are resolved once here instead of scanning per request
+        self._scenarios_by_id = {s.id: s for s in self._scenarios}
+        self._scenarios_by_stage = {
+            stage: [
+                s for s in self._scenarios
+                if "all" in s.suitable_for or stage in s.suitable_for
+            ]
+            for stage in self._STAGES
+        }
     
     def _build_causal_lookup(self) -> Dict[str, Dict[str, float]]:
         """Build lookup table for causal relationship strengths."""
@@ -206,13 +226,11 @@ class SimulationService:
     
     def get_scenarios(self, hospital_id: Optional[str] = None) -> List[Scenario]:
         """Get available scenarios, optionally filtered by hospital's current level."""
-        scenarios = self._scenarios.copy()
-        
         if hospital_id:
             latest = assessment_service.get_latest_by_hospital(hospital_id)
             if latest:
                 score = latest.overall_maturity_score or 0
-                
+
                 # Determine current stage
                 if score < 3.0:
                     stage = "below_good"
@@ -220,27 +238,57 @@ class SimulationService:
                     stage = "good_to_very_good"
                 else:
                     stage = "very_good_to_excellent"
-                
-                # Filter scenarios suitable for this stage
-                scenarios = [
-                    s for s in scenarios
-                    if "all" in s.suitable_for or stage in s.suitable_for
-                ]
-        
-        return scenarios
-    
+
+                return self._scenarios_by_stage[stage].copy()
+
+        return self._scenarios.copy()
+
     def get_scenario(self, scenario_id: str) -> Optional[Scenario]:
         """Get a specific scenario by ID."""
-        for s in self._scenarios:
-            if s.id == scenario_id:
-                return s
-        return None
+        return self._scenarios_by_id.get(scenario_id)
     
     def run_simulation(
         self,
         hospital_id: str,
         interventions: List[Intervention],
         scenario_name: str = "Custom Simulation"
+    ) -> SimulationResult:
+        """
+        Run a what-if simulation with the given interventions.
+
+        Results are memoized on the intervention set and the hospital's
+        assessment version: the UI typically runs the same scenario via
+        /run-scenario and again via /run-scenario/summary within
+        seconds, and the cascade walk is the expensive part. Any
+        assessment write rolls the version and invalidates the entry.
+        """
+        version = assessment_service.latest_updated_at(hospital_id)
+        key = (
+            hospital_id,
+            scenario_name,
+            str(version),
+            tuple(
+                (i.criterion_id, i.target_score, i.current_score,
+                 i.effort_level, i.timeline_months)
+                for i in interventions
+            ),
+        )
+        now = time.monotonic()
+        hit = self._result_cache.get(key)
+        if hit is not None and now - hit[0] < self._RESULT_CACHE_TTL:
+            return hit[1]
+
+        result = self._run_simulation(hospital_id, interventions, scenario_name)
+        if len(self._result_cache) >= self._RESULT_CACHE_MAX:
+            self._result_cache.clear()
+        self._result_cache[key] = (now, result)
+        return result
+
+    def _run_simulation(
+        self,
+        hospital_id: str,
+        interventions: List[Intervention],
+        scenario_name: str = "Custom Simulation"
     ) -> SimulationResult:
         """Run a what-if simulation with the given interventions."""
         # Get current assessment
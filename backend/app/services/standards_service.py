@@ -2,10 +2,32 @@
 Standards Service - HA Thailand Standards 5th Edition data model.
 Provides the complete standards framework with Parts, Chapters, and Criteria.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional
 from pydantic import BaseModel
 from enum import Enum
 
+import numpy as np
+
+
+class ScoreIndex(NamedTuple):
+    """Flat reduction index for vectorized assessment scoring."""
+    chapter_of_criterion: np.ndarray  # int32, criterion row -> chapter row
+    part_of_chapter: np.ndarray  # int32, chapter row -> part row
+    chapter_weights: np.ndarray  # float32, per chapter row
+    part_numbers: tuple  # part row -> part number ("I", "II", ...)
+    part_weights: np.ndarray  # float32, per part row
+    chapter_member: np.ndarray  # float32 one-hot, (n_criteria, n_chapters)
+    part_member: np.ndarray  # float32 one-hot, (n_chapters, n_parts)
+    n_criteria: int
+    n_chapters: int
+    n_parts: int
+
+
+# Overall-score weighting per part number; unknown parts get the
+# uniform fallback weight.
+_PART_WEIGHTS = {"I": 0.20, "II": 0.35, "III": 0.30, "IV": 0.15}
+_DEFAULT_PART_WEIGHT = 0.25
+
 
 class CriterionCategory(str, Enum):
     """Criterion classification categories."""
@@ -63,6 +85,141 @@ class StandardsService:
     
     def __init__(self):
         self._framework = self._build_framework()
+        # One-time indexes so per-criterion lookups are O(1) instead of a
+        # nested parts/chapters/criteria scan per request.
+        self._criterion_to_chapter: Dict[str, Chapter] = {}
+        self._chapter_to_part: Dict[str, Part] = {}
+        self._all_chapters: List[Chapter] = []
+        self._all_criteria: List[Criterion] = []
+        self._criteria_by_category: Dict[CriterionCategory, List[Criterion]] = {
+            category: [] for category in CriterionCategory
+        }
+        for part in self._framework.parts:
+            for chapter in part.chapters:
+                self._chapter_to_part[chapter.id] = part
+                self._all_chapters.append(chapter)
+                for criterion in chapter.criteria:
+                    self._criterion_to_chapter[criterion.id] = chapter
+                    self._all_criteria.append(criterion)
+                    self._criteria_by_category[criterion.category].append(criterion)
+        # Global criterion index and per-chapter index vectors so score
+        # aggregations can run over dense arrays instead of dict lookups.
+        self._criterion_index: Dict[str, int] = {
+            c.id: i for i, c in enumerate(self._all_criteria)
+        }
+        self._chapter_criterion_indices: Dict[str, np.ndarray] = {
+            chapter.id: np.array(
+                [self._criterion_index[c.id] for c in chapter.criteria],
+                dtype=np.int32,
+            )
+            for chapter in self._all_chapters
+        }
+        # Flat reduction index: per criterion its chapter row, per
+        # chapter its part row and weight. Assessment scoring collapses
+        # to a couple of bincounts over these instead of walking the
+        # parts/chapters/criteria tree.
+        chapter_row = {c.id: i for i, c in enumerate(self._all_chapters)}
+        part_row = {p.number: i for i, p in enumerate(self._framework.parts)}
+        chapter_of_criterion = np.array(
+            [chapter_row[self._criterion_to_chapter[c.id].id] for c in self._all_criteria],
+            dtype=np.int32,
+        )
+        part_of_chapter = np.array(
+            [part_row[self._chapter_to_part[c.id].number] for c in self._all_chapters],
+            dtype=np.int32,
+        )
+        # One-hot membership matrices so batch scoring can reduce whole
+        # (n_assessments, n_criteria) score matrices with two matmuls;
+        # the framework is small enough that dense float32 is fine.
+        chapter_member = np.zeros(
+            (len(self._all_criteria), len(self._all_chapters)), dtype=np.float32
+        )
+        chapter_member[np.arange(len(self._all_criteria)), chapter_of_criterion] = 1.0
+        part_member = np.zeros(
+            (len(self._all_chapters), len(self._framework.parts)), dtype=np.float32
+        )
+        part_member[np.arange(len(self._all_chapters)), part_of_chapter] = 1.0
+        self._score_index = ScoreIndex(
+            chapter_of_criterion=chapter_of_criterion,
+            part_of_chapter=part_of_chapter,
+            chapter_weights=np.array(
+                [c.weight for c in self._all_chapters], dtype=np.float32
+            ),
+            part_numbers=tuple(p.number for p in self._framework.parts),
+            part_weights=np.array(
+                [
+                    _PART_WEIGHTS.get(p.number, _DEFAULT_PART_WEIGHT)
+                    for p in self._framework.parts
+                ],
+                dtype=np.float32,
+            ),
+            chapter_member=chapter_member,
+            part_member=part_member,
+            n_criteria=len(self._all_criteria),
+            n_chapters=len(self._all_chapters),
+            n_parts=len(self._framework.parts),
+        )
+        # Boolean masks over the global criterion index, one per category,
+        # for vectorized category-met counting.
+        self._category_masks: Dict[CriterionCategory, np.ndarray] = {
+            category: np.zeros(len(self._all_criteria), dtype=bool)
+            for category in CriterionCategory
+        }
+        for i, criterion in enumerate(self._all_criteria):
+            self._category_masks[criterion.category][i] = True
+        # Relationship indexes so filtered queries scan only the matching
+        # bucket instead of the full relationship list.
+        self._rel_by_source: Dict[str, List[CausalRelationship]] = {}
+        self._rel_by_target: Dict[str, List[CausalRelationship]] = {}
+        self._rel_by_type: Dict[str, List[CausalRelationship]] = {}
+        self._rel_by_pair: Dict[tuple, CausalRelationship] = {}
+        for rel in self._framework.causal_relationships:
+            self._rel_by_source.setdefault(rel.source, []).append(rel)
+            self._rel_by_target.setdefault(rel.target, []).append(rel)
+            self._rel_by_type.setdefault(rel.relationship_type, []).append(rel)
+            self._rel_by_pair[(rel.source, rel.target)] = rel
+        # Parallel arrays over the relationship list so full-list filters
+        # (type/strength with no source or target) run as vectorized mask
+        # ops instead of per-object attribute lookups.
+        self._rel_type_code: Dict[str, int] = {}
+        type_codes = []
+        for rel in self._framework.causal_relationships:
+            code = self._rel_type_code.setdefault(
+                rel.relationship_type, len(self._rel_type_code)
+            )
+            type_codes.append(code)
+        self._rel_type_codes = np.array(type_codes, dtype=np.int32)
+        self._rel_strength = np.array(
+            [r.strength for r in self._framework.causal_relationships],
+            dtype=np.float32,
+        )
+        # The framework is immutable after this point, so aggregate
+        # statistics are computed once here rather than per request.
+        self._statistics = self._build_statistics()
+
+    def get_criterion_index(self) -> Dict[str, int]:
+        """Get the criterion_id -> global array index map."""
+        return self._criterion_index
+
+    def get_score_index(self) -> ScoreIndex:
+        """Get the flat criterion/chapter/part reduction index."""
+        return self._score_index
+
+    def get_chapter_criterion_indices(self, chapter_id: str) -> np.ndarray:
+        """Get the global score-array indices of a chapter's criteria."""
+        return self._chapter_criterion_indices[chapter_id]
+
+    def get_category_mask(self, category: CriterionCategory) -> np.ndarray:
+        """Get the boolean criterion mask for a category."""
+        return self._category_masks[category]
+
+    def get_chapter_for_criterion(self, criterion_id: str) -> Optional[Chapter]:
+        """Get the chapter a criterion belongs to."""
+        return self._criterion_to_chapter.get(criterion_id)
+
+    def get_part_for_chapter(self, chapter_id: str) -> Optional[Part]:
+        """Get the part a chapter belongs to."""
+        return self._chapter_to_part.get(chapter_id)
     
     def _build_framework(self) -> StandardsFramework:
         """Build the complete standards framework."""
@@ -817,18 +974,15 @@ class StandardsService:
     
     def get_all_chapters(self) -> List[Chapter]:
         """Get all chapters across all parts."""
-        chapters = []
-        for part in self._framework.parts:
-            chapters.extend(part.chapters)
-        return chapters
-    
+        return self._all_chapters
+
     def get_all_criteria(self) -> List[Criterion]:
         """Get all criteria across all chapters."""
-        criteria = []
-        for part in self._framework.parts:
-            for chapter in part.chapters:
-                criteria.extend(chapter.criteria)
-        return criteria
+        return self._all_criteria
+
+    def get_criteria_by_category(self, category: CriterionCategory) -> List[Criterion]:
+        """Get all criteria in a category."""
+        return self._criteria_by_category[category]
     
     def get_causal_relationships(self) -> List[CausalRelationship]:
         """Get all causal relationships."""
@@ -836,14 +990,100 @@ class StandardsService:
     
     def get_relationships_for_chapter(self, chapter_id: str) -> Dict[str, List[CausalRelationship]]:
         """Get relationships where the chapter is source or target."""
-        incoming = []
-        outgoing = []
-        for rel in self._framework.causal_relationships:
-            if rel.target == chapter_id:
-                incoming.append(rel)
-            if rel.source == chapter_id:
-                outgoing.append(rel)
-        return {"incoming": incoming, "outgoing": outgoing}
+        return {
+            "incoming": self._rel_by_target.get(chapter_id, []),
+            "outgoing": self._rel_by_source.get(chapter_id, []),
+        }
+
+    def _build_statistics(self) -> Dict:
+        """Aggregate framework-wide statistics (run once at init)."""
+        parts = self._framework.parts
+        criteria = self._all_criteria
+        relationships = self._framework.causal_relationships
+
+        avg_strength = (
+            sum(r.strength for r in relationships) / len(relationships)
+            if relationships else 0
+        )
+
+        return {
+            "parts": len(parts),
+            "chapters": len(self._all_chapters),
+            "criteria": {
+                "total": len(criteria),
+                "essential": len(self._criteria_by_category[CriterionCategory.ESSENTIAL]),
+                "core": len(self._criteria_by_category[CriterionCategory.CORE]),
+                "basic": len(self._criteria_by_category[CriterionCategory.BASIC]),
+            },
+            "relationships": {
+                "total": len(relationships),
+                "average_strength": round(avg_strength, 3),
+                "by_type": {
+                    rel_type: len(rels)
+                    for rel_type, rels in self._rel_by_type.items()
+                },
+            },
+            "parts_detail": [
+                {
+                    "number": p.number,
+                    "name": p.name,
+                    "chapters": len(p.chapters),
+                    "criteria": sum(len(c.criteria) for c in p.chapters),
+                }
+                for p in parts
+            ]
+        }
+
+    def get_statistics(self) -> Dict:
+        """Get precomputed statistics about the standards framework."""
+        return self._statistics
+
+    def get_relationship(self, source: str, target: str) -> Optional[CausalRelationship]:
+        """Get the relationship between two chapters, if any."""
+        return self._rel_by_pair.get((source, target))
+
+    def filter_relationships(
+        self,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        relationship_type: Optional[str] = None,
+        min_strength: Optional[float] = None,
+    ) -> List[CausalRelationship]:
+        """
+        Filter relationships, starting from the most selective index.
+
+        A single source or target matches only a handful of edges, so
+        the remaining predicates run over that small bucket. Queries
+        without either scan the whole list and use the vectorized
+        type/strength arrays instead.
+        """
+        if source is not None or target is not None:
+            if source is not None:
+                candidates = self._rel_by_source.get(source, [])
+            else:
+                candidates = self._rel_by_target.get(target, [])
+
+            results = []
+            for rel in candidates:
+                if target is not None and rel.target != target:
+                    continue
+                if relationship_type is not None and rel.relationship_type != relationship_type:
+                    continue
+                if min_strength is not None and rel.strength < min_strength:
+                    continue
+                results.append(rel)
+            return results
+
+        relationships = self._framework.causal_relationships
+        mask = np.ones(len(relationships), dtype=bool)
+        if relationship_type is not None:
+            code = self._rel_type_code.get(relationship_type)
+            if code is None:
+                return []
+            mask &= self._rel_type_codes == code
+        if min_strength is not None:
+            mask &= self._rel_strength >= min_strength
+        return [relationships[i] for i in np.nonzero(mask)[0]]
     
     def get_graph_data(self) -> Dict:
         """Get data formatted for Cytoscape.js visualization."""
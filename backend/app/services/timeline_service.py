@@ -7,6 +7,8 @@ from datetime import date, timedelta
 from typing import Optional
 import random
 
+import numpy as np
+
 from app.services.standards_service import StandardsService
 
 
@@ -17,6 +19,26 @@ class TimelineService:
         self.standards_service = StandardsService()
         self._snapshots: list[dict] = []
         self._generate_sample_snapshots()
+        # Snapshots are immutable once generated, so comparisons and
+        # chapter histories work off one contiguous score matrix and
+        # small lookup maps instead of re-walking snapshot dicts and the
+        # standards tree per request.
+        chapters = self.standards_service.get_all_chapters()
+        self._chapter_ids = [c.id for c in chapters]
+        self._chapter_index = {cid: i for i, cid in enumerate(self._chapter_ids)}
+        self._chapter_names = {c.id: c.name for c in chapters}
+        self._chapter_part = {
+            chapter.id: part.number
+            for part in self.standards_service.get_parts()
+            for chapter in part.chapters
+        }
+        self._score_matrix = np.array(
+            [
+                [s["scores"].get(cid, 0.0) for cid in self._chapter_ids]
+                for s in self._snapshots
+            ],
+            dtype=np.float64,
+        )
     
     def _generate_sample_snapshots(self):
         """Generate sample assessment snapshots over time."""
@@ -132,34 +154,28 @@ class TimelineService:
         
         if not from_snapshot or not to_snapshot:
             return {"error": "Invalid snapshot indices"}
-        
-        chapters = self.standards_service.get_all_chapters()
-        parts = self.standards_service.get_parts()
-        
-        # Create a mapping from chapter id to part number
-        chapter_to_part = {}
-        for part in parts:
-            for chapter in part.chapters:
-                chapter_to_part[chapter.id] = part.number
-        
-        changes = []
-        
-        for chapter in chapters:
-            chapter_id = chapter.id
-            from_score = from_snapshot["scores"].get(chapter_id, 0)
-            to_score = to_snapshot["scores"].get(chapter_id, 0)
-            change = round(to_score - from_score, 2)
-            
-            changes.append({
+
+        # Diff the two precomputed matrix rows in one vector op
+        from_row = self._score_matrix[from_index]
+        to_row = self._score_matrix[to_index]
+        diff = np.round(to_row - from_row, 2)
+        percent = np.zeros(len(diff))
+        np.divide(diff, from_row, out=percent, where=from_row > 0)
+        percent = np.round(percent * 100, 1)
+
+        changes = [
+            {
                 "chapter_id": chapter_id,
-                "chapter_name": chapter.name,
-                "part": chapter_to_part.get(chapter_id, "I"),
-                "from_score": from_score,
-                "to_score": to_score,
-                "change": change,
-                "change_percent": round((change / from_score * 100) if from_score > 0 else 0, 1),
-            })
-        
+                "chapter_name": self._chapter_names.get(chapter_id, "Unknown"),
+                "part": self._chapter_part.get(chapter_id, "I"),
+                "from_score": float(from_row[i]),
+                "to_score": float(to_row[i]),
+                "change": float(diff[i]),
+                "change_percent": float(percent[i]),
+            }
+            for i, chapter_id in enumerate(self._chapter_ids)
+        ]
+
         # Sort by absolute change
         changes = sorted(changes, key=lambda x: abs(x["change"]), reverse=True)
         
@@ -187,44 +203,41 @@ class TimelineService:
     
     def get_chapter_history(self, chapter_id: str) -> dict:
         """Get score history for a specific chapter across all snapshots."""
-        history = []
-        for snapshot in self._snapshots:
-            if chapter_id in snapshot["scores"]:
-                history.append({
-                    "date": snapshot["date"],
-                    "label": snapshot["label"],
-                    "score": snapshot["scores"][chapter_id],
-                    "overall": snapshot["overall_score"],
-                })
-        
+        col = self._chapter_index.get(chapter_id)
+        if col is None:
+            return {
+                "chapter_id": chapter_id,
+                "chapter_name": "Unknown",
+                "part": "Unknown",
+                "history": [],
+                "trend": "stable",
+                "total_change": 0,
+            }
+
+        # One matrix column holds the whole history
+        scores = self._score_matrix[:, col]
+        history = [
+            {
+                "date": snapshot["date"],
+                "label": snapshot["label"],
+                "score": float(scores[i]),
+                "overall": snapshot["overall_score"],
+            }
+            for i, snapshot in enumerate(self._snapshots)
+        ]
+
         # Calculate trend
         if len(history) >= 2:
-            first_score = history[0]["score"]
-            last_score = history[-1]["score"]
-            total_change = round(last_score - first_score, 2)
+            total_change = round(float(scores[-1] - scores[0]), 2)
             trend = "improving" if total_change > 0.2 else "declining" if total_change < -0.2 else "stable"
         else:
             total_change = 0
             trend = "stable"
-        
-        chapter = next(
-            (c for c in self.standards_service.get_all_chapters() if c.id == chapter_id),
-            None
-        )
-        
-        # Get part number for the chapter
-        parts = self.standards_service.get_parts()
-        chapter_part = "Unknown"
-        for part in parts:
-            for ch in part.chapters:
-                if ch.id == chapter_id:
-                    chapter_part = part.number
-                    break
-        
+
         return {
             "chapter_id": chapter_id,
-            "chapter_name": chapter.name if chapter else "Unknown",
-            "part": chapter_part,
+            "chapter_name": self._chapter_names.get(chapter_id, "Unknown"),
+            "part": self._chapter_part.get(chapter_id, "Unknown"),
             "history": history,
             "trend": trend,
             "total_change": total_change,
@@ -0,0 +1,55 @@
+"""Parity tests between the scalar and batch rescoring paths."""
+from datetime import date
+
+from app.models.assessment import Assessment, CriterionScore
+from app.services.assessment_service import assessment_service
+from app.services.standards_service import standards_service
+
+
+def _assessment_for_chapter(chapter, scores) -> Assessment:
+    """Build an assessment scoring the chapter's first criteria."""
+    return Assessment(
+        hospital_id="hosp-test-parity",
+        assessment_date=date(2024, 6, 1),
+        assessment_cycle="2024-Test",
+        criterion_scores=[
+            CriterionScore(criterion_id=criterion.id, score=score)
+            for criterion, score in zip(chapter.criteria, scores)
+        ],
+    )
+
+
+def _assert_parity(scores):
+    """Score the same input through both paths and compare every output."""
+    chapter = next(
+        c for c in standards_service.get_all_chapters()
+        if len(c.criteria) >= len(scores)
+    )
+    scalar = _assessment_for_chapter(chapter, scores)
+    batch = _assessment_for_chapter(chapter, scores)
+
+    assessment_service._calculate_assessment_scores(scalar)
+    assessment_service._recalculate_batch([batch])
+
+    assert batch.chapter_scores == scalar.chapter_scores
+    assert batch.part_scores == scalar.part_scores
+    assert batch.overall_maturity_score == scalar.overall_maturity_score
+    assert batch.accreditation_level == scalar.accreditation_level
+    return scalar
+
+
+def test_scalar_and_batch_rescoring_agree():
+    _assert_parity([3.5, 2.0, 4.0])
+
+
+def test_scalar_and_batch_agree_on_rounding_tie():
+    """A chapter average landing exactly on .xx5 must round identically.
+
+    [2.1, 2.7, 1.4, 2.1] averages 2.075; a float32 score vector degrades
+    that to 2.0749999... before rounding, so the batch path used to
+    persist 2.07 where the scalar path persisted 2.08.
+    """
+    scores = [2.1, 2.7, 1.4, 2.1]
+    scalar = _assert_parity(scores)
+    chapter_id = next(iter(scalar.chapter_scores))
+    assert scalar.chapter_scores[chapter_id] == 2.08
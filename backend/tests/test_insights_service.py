@@ -0,0 +1,43 @@
+"""Tests for insights service chapter grouping and gap analysis."""
+from datetime import date
+
+from app.models.assessment import Assessment, CriterionScore
+from app.services.insights_service import get_insights_service
+from app.services.standards_service import standards_service
+
+
+def _low_scoring_assessment(chapter) -> Assessment:
+    """Build an assessment scoring every criterion in the chapter at 1.5."""
+    return Assessment(
+        hospital_id="hosp-test-insights",
+        assessment_date=date(2024, 6, 1),
+        assessment_cycle="2024-Test",
+        criterion_scores=[
+            CriterionScore(criterion_id=criterion.id, score=1.5)
+            for criterion in chapter.criteria
+        ],
+    )
+
+
+def test_group_scores_by_chapter_keys_by_real_chapter_id():
+    """Dot-notation criterion ids ("I-1.1") must map to chapter "I-1"."""
+    service = get_insights_service()
+    chapter = standards_service.get_all_chapters()[0]
+    assessment = _low_scoring_assessment(chapter)
+
+    grouped = service._group_scores_by_chapter(assessment)
+
+    assert chapter.id in grouped
+    assert len(grouped[chapter.id]) == len(chapter.criteria)
+
+
+def test_gap_insights_flag_low_scoring_chapter():
+    """A chapter averaging below 2.5 must yield a gap-chapter insight."""
+    service = get_insights_service()
+    chapter = standards_service.get_all_chapters()[0]
+    assessment = _low_scoring_assessment(chapter)
+    scores_by_chapter = service._group_scores_by_chapter(assessment)
+
+    insights = service._generate_gap_insights(assessment, scores_by_chapter)
+
+    assert any(i["id"] == f"gap-chapter-{chapter.id}" for i in insights)